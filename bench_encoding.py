@@ -0,0 +1,113 @@
+#!/usr/bin/env python3
+"""Benchmark JSON against MessagePack check-in encoding."""
+
+import importlib.util
+import json
+import os
+import random
+import sys
+import timeit
+
+# Load the encoding module on its own, without Home Assistant
+ENCODING_PATH = os.path.join(
+    os.path.dirname(os.path.abspath(__file__)),
+    "custom_components", "pulseguard", "encoding.py",
+)
+spec = importlib.util.spec_from_file_location("pulseguard_encoding", ENCODING_PATH)
+encoding = importlib.util.module_from_spec(spec)
+spec.loader.exec_module(encoding)
+
+
+def make_payload(samples, processes, addons, services):
+    """Build a check-in payload of the given size."""
+    rng = random.Random(42)
+
+    metrics = {
+        "cpu_usage": round(rng.uniform(0, 100), 1),
+        "memory_usage": round(rng.uniform(0, 100), 1),
+        "disk_usage": round(rng.uniform(0, 100), 1),
+        "uptime": 123456,
+    }
+
+    return {
+        "hostname": "homeassistant",
+        "ip_address": "192.168.1.10",
+        "mac_address": "aa:bb:cc:dd:ee:ff",
+        "os_type": "homeassistant",
+        "os_version": "#1 SMP PREEMPT_DYNAMIC",
+        "system_specs": {"cpu_cores": 4, "total_memory": 7821},
+        "metrics": metrics,
+        "samples": [
+            {
+                "timestamp": 1700000000 + 60 * i,
+                "cpu_usage": round(rng.uniform(0, 100), 1),
+                "memory_usage": round(rng.uniform(0, 100), 1),
+                "disk_usage": round(rng.uniform(0, 100), 1),
+                "uptime": 123456 + 60 * i,
+            }
+            for i in range(samples)
+        ],
+        "process_stats": [
+            {
+                "pid": 100 + i,
+                "name": f"process-{i}",
+                "cpu_usage": round(rng.uniform(0, 10), 1),
+                "memory_usage": round(rng.uniform(0, 10), 1),
+            }
+            for i in range(processes)
+        ],
+        "services": [
+            {
+                "name": f"integration_{i}",
+                "type": "integration",
+                "status": "unavailable",
+                "unavailable": rng.randint(1, 20),
+                "unknown": rng.randint(0, 5),
+            }
+            for i in range(services)
+        ],
+        "additional_metrics": {
+            "addons": [
+                {
+                    "slug": f"addon_{i}",
+                    "name": f"Add-on {i}",
+                    "cpu_usage": round(rng.uniform(0, 20), 1),
+                    "memory_usage": round(rng.uniform(0, 20), 1),
+                    "memory_used": rng.randint(10, 500),
+                    "network_rx": rng.randint(0, 10 ** 9),
+                    "network_tx": rng.randint(0, 10 ** 9),
+                }
+                for i in range(addons)
+            ],
+        },
+    }
+
+
+def bench(name, payload, number):
+    """Print size and encode time of both encodings for a payload."""
+    print(f"\n{name}")
+    for label, encode in (
+        # The integration's default path: requests' json= uses json.dumps
+        ("json", encoding.encode_json),
+        ("msgpack", encoding.encode_msgpack),
+    ):
+        size = len(encode(payload))
+        seconds = timeit.timeit(lambda: encode(payload), number=number) / number
+        print(f"  {label:<8} {size:>8} bytes  {seconds * 1e6:>9.1f} us")
+
+
+def main():
+    """Run the benchmark."""
+    try:
+        import msgpack  # noqa: F401
+    except ImportError:
+        print("Install msgpack to run this benchmark: pip install msgpack")
+        sys.exit(1)
+
+    bench("Single check-in", make_payload(0, 0, 0, 0), 20000)
+    bench("Check-in with 10 services and 20 add-ons", make_payload(0, 0, 20, 10), 5000)
+    bench("Batch of 60 samples with 150 processes", make_payload(60, 150, 20, 10), 1000)
+
+
+if __name__ == "__main__":
+    main()
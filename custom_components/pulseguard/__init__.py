@@ -11,17 +11,40 @@ import voluptuous as vol
 
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.core import HomeAssistant
+from homeassistant.exceptions import HomeAssistantError
 from homeassistant.helpers.update_coordinator import DataUpdateCoordinator, UpdateFailed
 import homeassistant.helpers.config_validation as cv
 
 from .const import (
+    CHECK_IN_TIMEOUT,
     CONF_API_TOKEN,
     CONF_DEVICE_UUID,
     CONF_API_URL,
+    CONF_ADAPTIVE_UPLOAD,
+    CONF_ADDON_STATS,
+    CONF_BINARY_PAYLOAD,
+    CONF_ENABLE_HEARTBEAT,
+    CONF_ENABLE_PUSH,
+    CONF_HEARTBEAT_INTERVAL,
+    CONF_MAX_UPLOAD_INTERVAL,
+    DEFAULT_ADAPTIVE_UPLOAD,
+    DEFAULT_ADDON_STATS,
     DEFAULT_API_URL,
+    DEFAULT_BINARY_PAYLOAD,
+    DEFAULT_ENABLE_HEARTBEAT,
+    DEFAULT_ENABLE_PUSH,
+    DEFAULT_HEARTBEAT_INTERVAL,
+    DEFAULT_MAX_UPLOAD_INTERVAL,
     DOMAIN,
     PLATFORMS,
 )
+from .encoding import CONTENT_TYPE_JSON, PulseGuardPayloadEncoder, encode_payload
+from .health import PulseGuardHealthIndex
+from .heartbeat import PulseGuardHeartbeat
+from .push import PulseGuardPushChannel
+from .scheduler import PulseGuardUploadScheduler
+from .supervisor import PulseGuardSupervisorStats
+from .worker import async_get_worker_pool
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -46,8 +69,59 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry):
         api_url=api_url,
     )
     
+    # Optionally open a push channel so the server can reach the device
+    if entry.options.get(CONF_ENABLE_PUSH, DEFAULT_ENABLE_PUSH):
+        coordinator.push_channel = PulseGuardPushChannel(
+            hass,
+            coordinator,
+            api_token=api_token,
+            device_uuid=device_uuid,
+            api_url=api_url,
+        )
+    
+    # Optionally skip uploads while the metrics are stable
+    if entry.options.get(CONF_ADAPTIVE_UPLOAD, DEFAULT_ADAPTIVE_UPLOAD):
+        coordinator.upload_scheduler = PulseGuardUploadScheduler(
+            entry.options.get(CONF_MAX_UPLOAD_INTERVAL, DEFAULT_MAX_UPLOAD_INTERVAL)
+        )
+    
+    # Optionally collect per add-on stats on HA OS and Supervised installs
+    if entry.options.get(CONF_ADDON_STATS, DEFAULT_ADDON_STATS):
+        coordinator.supervisor_stats = PulseGuardSupervisorStats.from_env(hass)
+        if coordinator.supervisor_stats is None:
+            _LOGGER.warning("Add-on stats are enabled but the Supervisor is not available")
+    
+    # Optionally send a lightweight heartbeat between check-ins
+    if entry.options.get(CONF_ENABLE_HEARTBEAT, DEFAULT_ENABLE_HEARTBEAT):
+        coordinator.heartbeat = PulseGuardHeartbeat(
+            hass,
+            api_token=api_token,
+            api_url=api_url,
+            interval=entry.options.get(CONF_HEARTBEAT_INTERVAL, DEFAULT_HEARTBEAT_INTERVAL),
+            push_channel=coordinator.push_channel,
+        )
+    
+    # Optionally negotiate a compact binary encoding for check-ins
+    if entry.options.get(CONF_BINARY_PAYLOAD, DEFAULT_BINARY_PAYLOAD):
+        coordinator.payload_encoder = PulseGuardPayloadEncoder()
+    
+    # Start tracking entity and integration health before the first check-in
+    coordinator.health_index.async_start()
+    
     # Initial data update
-    await coordinator.async_config_entry_first_refresh()
+    try:
+        await coordinator.async_config_entry_first_refresh()
+    except Exception:
+        coordinator.health_index.async_stop()
+        raise
+    
+    if coordinator.push_channel is not None:
+        coordinator.push_channel.async_start(entry)
+    if coordinator.heartbeat is not None:
+        coordinator.heartbeat.async_start()
+    
+    # Reload the entry when the options change
+    entry.async_on_unload(entry.add_update_listener(async_reload_entry))
     
     # Store coordinator for this entry
     hass.data.setdefault(DOMAIN, {})
@@ -63,10 +137,19 @@ async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry):
     unload_ok = await hass.config_entries.async_unload_platforms(entry, PLATFORMS)
     
     if unload_ok:
-        hass.data[DOMAIN].pop(entry.entry_id)
+        coordinator = hass.data[DOMAIN].pop(entry.entry_id)
+        coordinator.health_index.async_stop()
+        if coordinator.heartbeat is not None:
+            coordinator.heartbeat.async_stop()
+        if coordinator.push_channel is not None:
+            await coordinator.push_channel.async_stop()
         
     return unload_ok
 
+async def async_reload_entry(hass: HomeAssistant, entry: ConfigEntry):
+    """Reload a config entry after its options changed."""
+    await hass.config_entries.async_reload(entry.entry_id)
+
 class PulseGuardCoordinator(DataUpdateCoordinator):
     """Data update coordinator for PulseGuard."""
     
@@ -85,25 +168,59 @@ class PulseGuardCoordinator(DataUpdateCoordinator):
         self.start_time = time.time()
         self.last_data_hash = None
         self.error_count = 0
+        self.push_channel = None
+        self.upload_scheduler = None
+        self.last_services = None
+        self.supervisor_stats = None
+        self.heartbeat = None
+        self.payload_encoder = None
+        self.health_index = PulseGuardHealthIndex(hass)
+        self.worker_pool = async_get_worker_pool(hass)
         
     async def _async_update_data(self):
         """Fetch data from PulseGuard API."""
         try:
             async with async_timeout.timeout(10):
-                # Get system stats
-                system_stats = await self.hass.async_add_executor_job(
-                    self._get_system_stats
-                )
-                
-                # Reset error count on successful update
-                if self.error_count > 0:
-                    self.error_count = 0
-                    _LOGGER.info("Successfully reconnected to PulseGuard API after %d errors", self.error_count)
-                
-                # Return all collected data
-                return {
-                    "system": system_stats,
-                }
+                # Get system stats, and add-on stats from the Supervisor at
+                # the same time. The add-on stats have a shorter deadline of
+                # their own and fall back to cached stats, so a slow
+                # Supervisor can't fail the update
+                addons = {}
+                if self.supervisor_stats is None:
+                    data = await self.worker_pool.async_run(
+                        self._get_system_stats, droppable=True
+                    )
+                else:
+                    data, addons = await asyncio.gather(
+                        self.worker_pool.async_run(self._get_system_stats, droppable=True),
+                        self.supervisor_stats.async_update(),
+                    )
+                    data["additional_metrics"]["addons"] = [
+                        {"slug": slug, **stats} for slug, stats in addons.items()
+                    ]
+            
+            # Attach the precomputed entity and integration health summary
+            data["services"] = self.health_index.services
+            data["additional_metrics"]["entity_health"] = self.health_index.entity_health
+            data["additional_metrics"]["worker_pool"] = self.worker_pool.stats
+            
+            # Send check-in to PulseGuard API, unless the adaptive
+            # scheduler decides this sample can be skipped. This runs outside
+            # the collection timeout so waiting for a push ack doesn't eat
+            # into it; the HTTP post has its own request timeout
+            if self._should_upload(data) and await self._async_send_check_in(data):
+                self._record_upload(data)
+            
+            # Reset error count on successful update
+            if self.error_count > 0:
+                self.error_count = 0
+                _LOGGER.info("Successfully reconnected to PulseGuard API after %d errors", self.error_count)
+            
+            # Return all collected data
+            return {
+                "system": data["metrics"],
+                "addons": addons,
+            }
         except Exception as err:
             self.error_count += 1
             # Only log every 5 errors to avoid flooding the logs
@@ -111,9 +228,91 @@ class PulseGuardCoordinator(DataUpdateCoordinator):
                 _LOGGER.error("Error #%d communicating with PulseGuard API: %s", self.error_count, err)
             raise UpdateFailed(f"Error communicating with API: {err}")
     
+    async def async_request_check_in(self):
+        """Take a sample right away and make sure it gets uploaded."""
+        if self.upload_scheduler is not None:
+            self.upload_scheduler.request_upload()
+        await self.async_request_refresh()
+    
+    def _should_upload(self, data):
+        """Return True if this sample has to be sent to PulseGuard."""
+        if self.upload_scheduler is None:
+            return True
+        
+        # Changes in entity or integration health are always sent right away
+        if data["services"] != self.last_services:
+            self.upload_scheduler.request_upload()
+        
+        return self.upload_scheduler.should_upload(
+            data["metrics"], self.update_interval.total_seconds()
+        )
+    
+    def _record_upload(self, data):
+        """Remember what was delivered, so failed check-ins are retried."""
+        self.last_services = data["services"]
+        if self.upload_scheduler is not None:
+            self.upload_scheduler.record_upload(
+                data["metrics"], self.update_interval.total_seconds()
+            )
+    
+    async def _async_send_check_in(self, data):
+        """Send a check-in over the push channel, or over HTTP as fallback.
+        
+        Returns True if the check-in was delivered.
+        """
+        # Only log the data if it has changed significantly or it's the first time.
+        # Dumping the payload is costly on large installs, so skip it unless
+        # debug logging is on
+        if _LOGGER.isEnabledFor(logging.DEBUG):
+            metrics = data["metrics"]
+            data_to_hash = "-".join(str(metrics[key]) for key in sorted(metrics))
+            current_hash = hashlib.md5(data_to_hash.encode()).hexdigest()
+            if self.last_data_hash is None or self.last_data_hash != current_hash:
+                _LOGGER.debug("Sending check-in to PulseGuard API with data: %s", json.dumps(data))
+                self.last_data_hash = current_hash
+        
+        # Streamed check-ins that are not acknowledged in time are posted
+        # over HTTP instead
+        if self.push_channel is not None and self.push_channel.connected:
+            if await self.push_channel.async_send_check_in(data):
+                return True
+        
+        try:
+            async with async_timeout.timeout(CHECK_IN_TIMEOUT):
+                return await self._async_post_check_in(data)
+        except (asyncio.TimeoutError, HomeAssistantError) as err:
+            _LOGGER.error("Error sending check-in to PulseGuard API: %s", str(err) or "timeout")
+            return False
+    
+    async def _async_post_check_in(self, data):
+        """Post a check-in over HTTP, return True on success.
+        
+        The payload encoder is negotiated here, on the event loop, so its
+        state is never changed from a worker thread.
+        """
+        encoder = self.payload_encoder
+        if encoder is None:
+            response = await self.worker_pool.async_run(self._send_check_in, data)
+        else:
+            # Offer MessagePack and use it once the server accepted it
+            content_type = encoder.content_type
+            response = await self.worker_pool.async_run(
+                self._send_check_in, data, content_type, encoder.accept
+            )
+            if response is None:
+                return False
+            if response.status_code == 415 and content_type != CONTENT_TYPE_JSON:
+                encoder.reject()
+                response = await self.worker_pool.async_run(
+                    self._send_check_in, data, CONTENT_TYPE_JSON, encoder.accept
+                )
+            elif response.status_code < 400:
+                encoder.negotiate(response.headers.get("Content-Type"))
+        
+        return response is not None and response.status_code < 400
+    
     def _get_system_stats(self):
         """Get system statistics."""
-        import requests
         import psutil
         
         # Get system metrics similar to what the Linux agent collects
@@ -156,12 +355,8 @@ class PulseGuardCoordinator(DataUpdateCoordinator):
             "uptime": uptime_seconds
         }
         
-        # Calculate a hash of the data to check if it has changed
-        data_to_hash = f"{cpu_usage}-{memory_usage}-{disk_usage}-{uptime_seconds}"
-        current_hash = hashlib.md5(data_to_hash.encode()).hexdigest()
-        
         # Create the full data payload
-        data = {
+        return {
             "hostname": hostname,
             "ip_address": ip_address,
             "mac_address": mac_address,
@@ -169,40 +364,38 @@ class PulseGuardCoordinator(DataUpdateCoordinator):
             "os_version": os_version,
             "system_specs": system_specs,
             "metrics": metrics,
-            "services": []
+            "services": [],
+            "additional_metrics": {}
         }
+    
+    def _send_check_in(self, data, content_type=CONTENT_TYPE_JSON, accept=CONTENT_TYPE_JSON):
+        """Post a check-in to the PulseGuard API, return the response or None."""
+        import requests
         
-        # Send check-in to PulseGuard API
         check_in_url = f"{self.api_url}/devices/check-in"
         
         headers = {
-            "Content-Type": "application/json",
+            "Content-Type": content_type,
             "X-API-Token": self.api_token,
-            "Accept": "application/json"
+            "Accept": accept
         }
         
         try:
-            # Only log the data if it has changed significantly or it's the first time
-            if self.last_data_hash is None or self.last_data_hash != current_hash:
-                _LOGGER.debug("Sending check-in to PulseGuard API with data: %s", json.dumps(data))
-                self.last_data_hash = current_hash
-            
-            response = requests.post(check_in_url, headers=headers, json=data, timeout=10)
-            
-            # Log response only if it's an error
-            if response.status_code >= 400:
-                _LOGGER.error("Error response from PulseGuard API: %s - %s", 
-                             response.status_code, response.text)
-            response.raise_for_status()
-            
-            # Return the metrics as they'll be needed for the sensors
-            return metrics
+            response = requests.post(
+                check_in_url, headers=headers, data=encode_payload(data, content_type), timeout=10
+            )
         except requests.exceptions.RequestException as err:
             _LOGGER.error("Error sending check-in to PulseGuard API: %s", err)
-            # Include response details if available
-            if hasattr(err, "response") and err.response is not None:
-                _LOGGER.error("Response content: %s", err.response.text)
-            return metrics
+            return None
+        
+        # Log response only if it's an error; a refused MessagePack check-in
+        # is retried as JSON by the caller
+        if response.status_code >= 400 and not (
+            response.status_code == 415 and content_type != CONTENT_TYPE_JSON
+        ):
+            _LOGGER.error("Error response from PulseGuard API: %s - %s", 
+                         response.status_code, response.text)
+        return response
     
     def _get_local_ip(self):
         """Get the local IP address."""
@@ -8,7 +8,7 @@ from typing import Any
 import voluptuous as vol
 
 from homeassistant import config_entries
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, callback
 from homeassistant.data_entry_flow import FlowResult
 from homeassistant.exceptions import HomeAssistantError
 
@@ -16,9 +16,28 @@ from .const import (
     CONF_API_TOKEN,
     CONF_DEVICE_UUID,
     CONF_API_URL,
+    CONF_ADAPTIVE_UPLOAD,
+    CONF_ADDON_STATS,
+    CONF_BINARY_PAYLOAD,
+    CONF_ENABLE_HEARTBEAT,
+    CONF_ENABLE_PUSH,
+    CONF_HEARTBEAT_INTERVAL,
+    CONF_MAX_UPLOAD_INTERVAL,
+    DEFAULT_ADAPTIVE_UPLOAD,
+    DEFAULT_ADDON_STATS,
     DEFAULT_API_URL,
+    DEFAULT_BINARY_PAYLOAD,
+    DEFAULT_ENABLE_HEARTBEAT,
+    DEFAULT_ENABLE_PUSH,
+    DEFAULT_HEARTBEAT_INTERVAL,
+    DEFAULT_MAX_UPLOAD_INTERVAL,
     DOMAIN,
+    MAX_HEARTBEAT_INTERVAL,
+    MAX_MAX_UPLOAD_INTERVAL,
+    MIN_HEARTBEAT_INTERVAL,
+    MIN_MAX_UPLOAD_INTERVAL,
 )
+from .worker import async_get_worker_pool
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -32,126 +51,132 @@ STEP_USER_DATA_SCHEMA = vol.Schema(
 )
 
 
+def _validate_input(data: dict[str, Any]) -> dict[str, Any]:
+    """Collect system info and post a test check-in, blocking."""
+    import requests
+    import platform
+    import socket
+    import uuid
+    import psutil
+    
+    # Try to call the API to validate the credentials
+    api_url = data.get(CONF_API_URL, DEFAULT_API_URL)
+    device_uuid = data[CONF_DEVICE_UUID]
+    api_token = data[CONF_API_TOKEN]
+    
+    # Get system info for validation request
+    hostname = platform.node()
+    
+    # Get IP address
+    try:
+        s = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+        s.connect(("8.8.8.8", 80))
+        ip_address = s.getsockname()[0]
+        s.close()
+    except Exception:
+        # Use a specific IP to avoid "Unknown" which the API may reject
+        ip_address = "127.0.0.1"
+    
+    # Get MAC address
+    try:
+        mac = ':'.join(['{:02x}'.format((uuid.getnode() >> elements) & 0xff)
+                        for elements in range(0, 8 * 6, 8)][::-1])
+    except Exception:
+        mac = "00:00:00:00:00:00"
+    
+    # Get system metrics - use cpu_percent without interval to avoid blocking
+    cpu_usage = psutil.cpu_percent(interval=None)  # Non-blocking call
+    memory = psutil.virtual_memory()
+    memory_usage = memory.percent
+    disk = psutil.disk_usage('/')
+    disk_usage = disk.percent
+    
+    # Create system specs payload - must be an object
+    system_specs = {
+        "cpu_cores": psutil.cpu_count(logical=True),
+        "total_memory": memory.total // (1024 * 1024)  # Convert to MB
+    }
+    
+    # Create metrics payload - must be an object
+    metrics = {
+        "cpu_usage": cpu_usage,
+        "memory_usage": memory_usage,
+        "disk_usage": disk_usage,
+        "uptime": 60  # Just a placeholder for validation
+    }
+      # Create validation data with all required fields
+    validation_data = {
+        "token": api_token,  # Add token field
+        "uuid": device_uuid,  # Add uuid field
+        "device_uuid": device_uuid,  # Keep device_uuid for compatibility
+        "hostname": f"Home Assistant - {hostname}",
+        "ip_address": ip_address,
+        "mac_address": mac,
+        "os_type": "homeassistant",
+        "os_version": platform.version(),
+        "system_specs": system_specs,
+        "cpu_usage": cpu_usage,  # Add top-level metrics as in main.js
+        "memory_usage": memory_usage,
+        "disk_usage": disk_usage,
+        "uptime_seconds": 60,  # Add uptime_seconds instead of uptime
+        "services": [],
+        "network_stats": [],  # Add empty network stats
+        "process_stats": [],  # Add empty process stats
+        "additional_metrics": {}  # Add empty additional metrics
+    }
+    
+    # Force string values for fields that require strings
+    validation_data["ip_address"] = str(validation_data["ip_address"])
+    validation_data["mac_address"] = str(validation_data["mac_address"])
+    validation_data["os_type"] = str(validation_data["os_type"])
+    validation_data["os_version"] = str(validation_data["os_version"])
+    
+    # Log the validation data for debugging
+    json_data = json.dumps(validation_data, indent=2)
+    _LOGGER.debug("VALIDATION DATA PAYLOAD: %s", json_data)
+    
+    # Set up headers
+    headers = {
+        "Content-Type": "application/json",
+        "X-API-Token": api_token,
+        "Accept": "application/json",
+    }
+    
+    _LOGGER.debug("API URL: %s", f"{api_url}/devices/check-in")
+    _LOGGER.debug("Headers: %s", json.dumps(headers))
+    
+    # Test API connectivity
+    response = requests.post(
+        f"{api_url}/devices/check-in",
+        headers=headers,
+        json=validation_data,
+        timeout=30,  # Longer timeout for initial connection
+    )
+    
+    # Log response details
+    _LOGGER.debug("API Response Status: %s", response.status_code)
+    _LOGGER.debug("API Response Body: %s", response.text)
+    
+    # If the server responds with an error, raise an exception
+    response.raise_for_status()
+    
+    # Return validated data
+    return {
+        CONF_DEVICE_UUID: device_uuid,
+        CONF_API_TOKEN: api_token,
+        CONF_API_URL: api_url,
+    }
+
+
 async def validate_input(hass: HomeAssistant, data: dict[str, Any]) -> dict[str, Any]:
     """Validate the user input allows us to connect."""
-    # Validate the API token and device UUID by making a test API call
+    import requests
+    
+    # Validate the API token and device UUID by making a test API call. The
+    # system info, the IP probe and the request can all block, so the whole
+    # check runs on our own worker pool
     try:
-        import requests
-        import platform
-        import socket
-        import uuid
-        import psutil
-        
-        # Try to call the API to validate the credentials
-        api_url = data.get(CONF_API_URL, DEFAULT_API_URL)
-        device_uuid = data[CONF_DEVICE_UUID]
-        api_token = data[CONF_API_TOKEN]
-        
-        # Get system info for validation request
-        hostname = platform.node()
-        
-        # Get IP address
-        try:
-            s = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
-            s.connect(("8.8.8.8", 80))
-            ip_address = s.getsockname()[0]
-            s.close()
-        except Exception:
-            # Use a specific IP to avoid "Unknown" which the API may reject
-            ip_address = "127.0.0.1"
-            
-        # Get MAC address
-        try:
-            mac = ':'.join(['{:02x}'.format((uuid.getnode() >> elements) & 0xff)
-                            for elements in range(0, 8 * 6, 8)][::-1])
-        except Exception:
-            mac = "00:00:00:00:00:00"
-        
-        # Get system metrics - use cpu_percent without interval to avoid blocking
-        # and run the blocking operation in a separate thread if needed
-        cpu_usage = psutil.cpu_percent(interval=None)  # Non-blocking call
-        memory = psutil.virtual_memory()
-        memory_usage = memory.percent
-        disk = psutil.disk_usage('/')
-        disk_usage = disk.percent
-        
-        # Create system specs payload - must be an object
-        system_specs = {
-            "cpu_cores": psutil.cpu_count(logical=True),
-            "total_memory": memory.total // (1024 * 1024)  # Convert to MB
-        }
-        
-        # Create metrics payload - must be an object
-        metrics = {
-            "cpu_usage": cpu_usage,
-            "memory_usage": memory_usage,
-            "disk_usage": disk_usage,
-            "uptime": 60  # Just a placeholder for validation
-        }
-          # Create validation data with all required fields
-        validation_data = {
-            "token": api_token,  # Add token field
-            "uuid": device_uuid,  # Add uuid field
-            "device_uuid": device_uuid,  # Keep device_uuid for compatibility
-            "hostname": f"Home Assistant - {hostname}",
-            "ip_address": ip_address,
-            "mac_address": mac,
-            "os_type": "homeassistant",
-            "os_version": platform.version(),
-            "system_specs": system_specs,
-            "cpu_usage": cpu_usage,  # Add top-level metrics as in main.js
-            "memory_usage": memory_usage,
-            "disk_usage": disk_usage,
-            "uptime_seconds": 60,  # Add uptime_seconds instead of uptime
-            "services": [],
-            "network_stats": [],  # Add empty network stats
-            "process_stats": [],  # Add empty process stats
-            "additional_metrics": {}  # Add empty additional metrics
-        }
-        
-        # Force string values for fields that require strings
-        validation_data["ip_address"] = str(validation_data["ip_address"])
-        validation_data["mac_address"] = str(validation_data["mac_address"])
-        validation_data["os_type"] = str(validation_data["os_type"])
-        validation_data["os_version"] = str(validation_data["os_version"])
-        
-        # Log the validation data for debugging
-        json_data = json.dumps(validation_data, indent=2)
-        _LOGGER.debug("VALIDATION DATA PAYLOAD: %s", json_data)
-        
-        # Set up headers
-        headers = {
-            "Content-Type": "application/json",
-            "X-API-Token": api_token,
-            "Accept": "application/json",
-        }
-        
-        _LOGGER.debug("API URL: %s", f"{api_url}/devices/check-in")
-        _LOGGER.debug("Headers: %s", json.dumps(headers))
-        
-        # Test API connectivity - make the call synchronously in a thread
-        response = await hass.async_add_executor_job(
-            lambda: requests.post(
-                f"{api_url}/devices/check-in",
-                headers=headers,
-                json=validation_data,
-                timeout=30,  # Longer timeout for initial connection
-            )
-        )
-        
-        # Log response details
-        _LOGGER.debug("API Response Status: %s", response.status_code)
-        _LOGGER.debug("API Response Body: %s", response.text)
-        
-        # If the server responds with an error, raise an exception
-        response.raise_for_status()
-        
-        # Return validated data
-        return {
-            CONF_DEVICE_UUID: device_uuid,
-            CONF_API_TOKEN: api_token,
-            CONF_API_URL: api_url,
-        }
+        return await async_get_worker_pool(hass).async_run(_validate_input, data)
     except requests.exceptions.RequestException as err:
         _LOGGER.error("Error connecting to PulseGuard API: %s", err)
         if hasattr(err, "response") and err.response is not None:
@@ -168,6 +193,14 @@ class PulseGuardConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
 
     VERSION = 1
 
+    @staticmethod
+    @callback
+    def async_get_options_flow(
+        config_entry: config_entries.ConfigEntry,
+    ) -> config_entries.OptionsFlow:
+        """Get the options flow for this handler."""
+        return PulseGuardOptionsFlow(config_entry)
+
     async def async_step_user(self, user_input: dict[str, Any] | None = None) -> FlowResult:
         """Handle the initial step."""
         errors: dict[str, str] = {}
@@ -205,6 +238,66 @@ class PulseGuardConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
         )
 
 
+class PulseGuardOptionsFlow(config_entries.OptionsFlow):
+    """Handle PulseGuard options."""
+
+    def __init__(self, config_entry: config_entries.ConfigEntry) -> None:
+        """Initialize the options flow."""
+        self._entry = config_entry
+
+    async def async_step_init(self, user_input: dict[str, Any] | None = None) -> FlowResult:
+        """Manage the PulseGuard options."""
+        if user_input is not None:
+            return self.async_create_entry(title="", data=user_input)
+        
+        options = self._entry.options
+        return self.async_show_form(
+            step_id="init",
+            data_schema=vol.Schema(
+                {
+                    vol.Optional(
+                        CONF_ENABLE_PUSH,
+                        default=options.get(CONF_ENABLE_PUSH, DEFAULT_ENABLE_PUSH),
+                    ): bool,
+                    vol.Optional(
+                        CONF_ADAPTIVE_UPLOAD,
+                        default=options.get(CONF_ADAPTIVE_UPLOAD, DEFAULT_ADAPTIVE_UPLOAD),
+                    ): bool,
+                    vol.Optional(
+                        CONF_MAX_UPLOAD_INTERVAL,
+                        default=options.get(
+                            CONF_MAX_UPLOAD_INTERVAL, DEFAULT_MAX_UPLOAD_INTERVAL
+                        ),
+                    ): vol.All(
+                        vol.Coerce(int),
+                        vol.Range(min=MIN_MAX_UPLOAD_INTERVAL, max=MAX_MAX_UPLOAD_INTERVAL),
+                    ),
+                    vol.Optional(
+                        CONF_ADDON_STATS,
+                        default=options.get(CONF_ADDON_STATS, DEFAULT_ADDON_STATS),
+                    ): bool,
+                    vol.Optional(
+                        CONF_ENABLE_HEARTBEAT,
+                        default=options.get(CONF_ENABLE_HEARTBEAT, DEFAULT_ENABLE_HEARTBEAT),
+                    ): bool,
+                    vol.Optional(
+                        CONF_HEARTBEAT_INTERVAL,
+                        default=options.get(
+                            CONF_HEARTBEAT_INTERVAL, DEFAULT_HEARTBEAT_INTERVAL
+                        ),
+                    ): vol.All(
+                        vol.Coerce(int),
+                        vol.Range(min=MIN_HEARTBEAT_INTERVAL, max=MAX_HEARTBEAT_INTERVAL),
+                    ),
+                    vol.Optional(
+                        CONF_BINARY_PAYLOAD,
+                        default=options.get(CONF_BINARY_PAYLOAD, DEFAULT_BINARY_PAYLOAD),
+                    ): bool,
+                }
+            ),
+        )
+
+
 class CannotConnect(HomeAssistantError):
     """Error to indicate we cannot connect."""
 
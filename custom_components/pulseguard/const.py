@@ -7,8 +7,57 @@ CONF_API_TOKEN = "api_token"
 CONF_DEVICE_UUID = "device_uuid"
 CONF_API_URL = "api_url"
 
+# Time allowed for posting a check-in, including waiting for a worker
+CHECK_IN_TIMEOUT = 30
+
+# Options keys
+CONF_ENABLE_PUSH = "enable_push"
+CONF_ADAPTIVE_UPLOAD = "adaptive_upload"
+CONF_MAX_UPLOAD_INTERVAL = "max_upload_interval"
+CONF_ADDON_STATS = "addon_stats"
+CONF_ENABLE_HEARTBEAT = "enable_heartbeat"
+CONF_HEARTBEAT_INTERVAL = "heartbeat_interval"
+CONF_BINARY_PAYLOAD = "binary_payload"
+
 # Default values
 DEFAULT_API_URL = "https://app.pulseguard.nl/api"
+DEFAULT_ENABLE_PUSH = False
+DEFAULT_ADAPTIVE_UPLOAD = False
+DEFAULT_MAX_UPLOAD_INTERVAL = 300
+DEFAULT_ADDON_STATS = False
+DEFAULT_ENABLE_HEARTBEAT = False
+DEFAULT_HEARTBEAT_INTERVAL = 10
+DEFAULT_BINARY_PAYLOAD = False
+
+# Push channel settings (seconds)
+PUSH_PING_INTERVAL = 30
+PUSH_RECONNECT_MIN = 5
+PUSH_RECONNECT_MAX = 600
+PUSH_MIN_UPDATE_INTERVAL = 10
+PUSH_MAX_UPDATE_INTERVAL = 3600
+PUSH_ACK_TIMEOUT = 5
+PUSH_MAX_MISSED_ACKS = 3
+
+# Adaptive upload settings
+MIN_MAX_UPLOAD_INTERVAL = 60
+MAX_MAX_UPLOAD_INTERVAL = 3600
+ADAPTIVE_ALERT_LEVEL = 85  # % usage that counts as close to an alert
+ADAPTIVE_CHANGE_THRESHOLD = 10  # % points change that is uploaded right away
+ADAPTIVE_VOLATILITY_THRESHOLD = 3  # average % points change per sample
+ADAPTIVE_SMOOTHING = 0.3
+
+# Supervisor add-on stats settings
+SUPERVISOR_ADDONS_TTL = 600  # seconds between refreshes of the add-on list
+SUPERVISOR_STATS_TTL = 110  # seconds an add-on's stats are cached
+SUPERVISOR_MAX_FETCHES = 8  # stats requests per update
+SUPERVISOR_MAX_CONCURRENCY = 4  # stats requests in flight
+SUPERVISOR_TIMEOUT = 3  # seconds per request
+SUPERVISOR_UPDATE_TIMEOUT = 4  # seconds per update, then cached stats are used
+
+# Heartbeat settings (seconds)
+MIN_HEARTBEAT_INTERVAL = 2
+MAX_HEARTBEAT_INTERVAL = 60
+HEARTBEAT_UNSUPPORTED_RETRY = 300  # retry delay when the server has no heartbeat endpoint
 
 # Entity attributes
 ATTR_CPU_USAGE = "cpu_usage"
@@ -16,6 +65,11 @@ ATTR_MEMORY_USAGE = "memory_usage"
 ATTR_DISK_USAGE = "disk_usage"
 ATTR_UPTIME = "uptime"
 
+# Dedicated worker pool for blocking work
+DATA_WORKER_POOL = f"{DOMAIN}_worker_pool"
+WORKER_MAX_THREADS = 3
+WORKER_MAX_QUEUE = 10
+
 # Platform types
 PLATFORMS = ["sensor"]
 
@@ -25,6 +79,8 @@ SENSOR_TYPE_MEMORY = "memory"
 SENSOR_TYPE_DISK = "disk"
 SENSOR_TYPE_UPTIME = "uptime"
 SENSOR_TYPE_STATUS = "status"
+SENSOR_TYPE_ADDON_CPU = "addon_cpu"
+SENSOR_TYPE_ADDON_MEMORY = "addon_memory"
 
 # Sensor names
 SENSOR_NAME_CPU = "CPU Usage"
@@ -32,6 +88,8 @@ SENSOR_NAME_MEMORY = "Memory Usage"
 SENSOR_NAME_DISK = "Disk Usage"
 SENSOR_NAME_UPTIME = "Uptime"
 SENSOR_NAME_STATUS = "Status"
+SENSOR_NAME_ADDON_CPU = "CPU Usage"
+SENSOR_NAME_ADDON_MEMORY = "Memory Usage"
 
 # Sensor units
 SENSOR_UNIT_PERCENTAGE = "%"
@@ -0,0 +1,99 @@
+"""Check-in payload encoding for the PulseGuard integration.
+
+Check-ins are JSON by default. When the server says it understands
+MessagePack, by answering a check-in with a MessagePack content type, later
+check-ins are sent as MessagePack. Before packing, lists of records that
+share the same keys (services, add-ons, samples) are stored column by
+column, as ``{"_columns": {"key": [value, ...]}}``, so repeated key names
+are sent only once. A server that answers 415 sends the integration back to
+JSON for good. The msgpack package is installed with the integration; if
+it still can't be imported, check-ins stay JSON.
+
+The encoder's state is only read and changed on the event loop; the worker
+thread posting a check-in just encodes it with the content type it is given.
+"""
+import json
+import logging
+
+_LOGGER = logging.getLogger(__name__)
+
+CONTENT_TYPE_JSON = "application/json"
+CONTENT_TYPE_MSGPACK = "application/msgpack"
+MSGPACK_CONTENT_TYPES = (CONTENT_TYPE_MSGPACK, "application/x-msgpack")
+
+COLUMNS_KEY = "_columns"
+
+
+def columnize(value):
+    """Return a copy of value with lists of uniform records stored by column."""
+    if isinstance(value, dict):
+        return {key: columnize(item) for key, item in value.items()}
+    if isinstance(value, list):
+        if (
+            len(value) > 1
+            and all(isinstance(item, dict) for item in value)
+            and all(item.keys() == value[0].keys() for item in value)
+        ):
+            return {
+                COLUMNS_KEY: {
+                    key: [columnize(item[key]) for item in value] for key in value[0]
+                }
+            }
+        return [columnize(item) for item in value]
+    return value
+
+
+def encode_json(data):
+    """Encode a payload as JSON."""
+    return json.dumps(data).encode()
+
+
+def encode_msgpack(data):
+    """Encode a payload as column-oriented MessagePack."""
+    import msgpack
+
+    return msgpack.packb(columnize(data), use_bin_type=True)
+
+
+def encode_payload(data, content_type):
+    """Encode a payload with the given content type."""
+    if content_type == CONTENT_TYPE_MSGPACK:
+        return encode_msgpack(data)
+    return encode_json(data)
+
+
+class PulseGuardPayloadEncoder:
+    """Negotiate and apply the check-in encoding."""
+
+    def __init__(self):
+        """Initialize the encoder, starting with JSON."""
+        self.content_type = CONTENT_TYPE_JSON
+        try:
+            import msgpack  # noqa: F401
+        except ImportError:
+            _LOGGER.warning("MessagePack is not installed, check-ins will use JSON")
+            self.msgpack_available = False
+        else:
+            self.msgpack_available = True
+
+    @property
+    def accept(self):
+        """Return the Accept header for check-ins."""
+        if self.msgpack_available:
+            return f"{CONTENT_TYPE_MSGPACK}, {CONTENT_TYPE_JSON};q=0.9"
+        return CONTENT_TYPE_JSON
+
+    def negotiate(self, response_content_type):
+        """Switch to MessagePack if the server answered with it."""
+        if not self.msgpack_available or self.content_type == CONTENT_TYPE_MSGPACK:
+            return
+        media_type = (response_content_type or "").split(";")[0].strip().lower()
+        if media_type in MSGPACK_CONTENT_TYPES:
+            _LOGGER.info("PulseGuard API supports MessagePack, switching check-ins to it")
+            self.content_type = CONTENT_TYPE_MSGPACK
+
+    def reject(self):
+        """Go back to JSON after the server refused MessagePack."""
+        _LOGGER.warning("PulseGuard API refused MessagePack, switching check-ins back to JSON")
+        self.content_type = CONTENT_TYPE_JSON
+        self.msgpack_available = False
@@ -0,0 +1,193 @@
+"""Entity and integration health index for the PulseGuard integration."""
+import logging
+from collections import defaultdict
+
+from homeassistant.config_entries import (
+    SIGNAL_CONFIG_ENTRY_CHANGED,
+    ConfigEntry,
+    ConfigEntryChange,
+    ConfigEntryState,
+)
+from homeassistant.const import EVENT_STATE_CHANGED, STATE_UNAVAILABLE, STATE_UNKNOWN
+from homeassistant.core import Event, HomeAssistant, callback
+from homeassistant.helpers import entity_registry as er
+from homeassistant.helpers.dispatcher import async_dispatcher_connect
+
+_LOGGER = logging.getLogger(__name__)
+
+# Entity states that count as a problem
+PROBLEM_STATES = (STATE_UNAVAILABLE, STATE_UNKNOWN)
+
+# Config entry states that count as failed
+FAILED_ENTRY_STATES = {
+    ConfigEntryState.SETUP_ERROR,
+    ConfigEntryState.SETUP_RETRY,
+    ConfigEntryState.MIGRATION_ERROR,
+    ConfigEntryState.FAILED_UNLOAD,
+}
+
+
+class PulseGuardHealthIndex:
+    """Incremental index of unavailable entities and failed config entries.
+
+    The state machine is scanned once at start. After that the counters are
+    kept up to date from state change and config entry events, so building
+    the check-in summary never has to look at every entity again.
+    """
+
+    def __init__(self, hass: HomeAssistant):
+        """Initialize the health index."""
+        self.hass = hass
+        self.entity_count = 0
+        self._registry = None
+        # entity_id -> (state, domain, integration) for problem entities only
+        self._problems = {}
+        self._domains = defaultdict(lambda: {STATE_UNAVAILABLE: 0, STATE_UNKNOWN: 0})
+        self._integrations = defaultdict(lambda: {STATE_UNAVAILABLE: 0, STATE_UNKNOWN: 0})
+        # entry_id -> (domain, title, state) for failed config entries only
+        self._failed_entries = {}
+        self._unsubs = []
+        self._services = []
+        self._entity_health = {}
+        self._dirty = True
+
+    @callback
+    def async_start(self):
+        """Seed the index and subscribe to changes."""
+        self._registry = er.async_get(self.hass)
+
+        for state in self.hass.states.async_all():
+            self.entity_count += 1
+            self._async_set_status(state.entity_id, state.state)
+
+        for entry in self.hass.config_entries.async_entries():
+            self._async_set_entry_state(entry)
+
+        self._unsubs.append(
+            self.hass.bus.async_listen(EVENT_STATE_CHANGED, self._async_state_changed)
+        )
+        self._unsubs.append(
+            async_dispatcher_connect(
+                self.hass, SIGNAL_CONFIG_ENTRY_CHANGED, self._async_entry_changed
+            )
+        )
+
+    @callback
+    def async_stop(self):
+        """Unsubscribe from all events."""
+        while self._unsubs:
+            self._unsubs.pop()()
+
+    @property
+    def services(self):
+        """Return the summary for the `services` field of a check-in."""
+        self._async_rebuild()
+        return self._services
+
+    @property
+    def entity_health(self):
+        """Return entity counts per domain for the check-in payload."""
+        self._async_rebuild()
+        return self._entity_health
+
+    @callback
+    def _async_state_changed(self, event: Event):
+        """Update the counters for a single state change."""
+        entity_id = event.data["entity_id"]
+        old_state = event.data.get("old_state")
+        new_state = event.data.get("new_state")
+
+        if old_state is None:
+            self.entity_count += 1
+            self._dirty = True
+        if new_state is None:
+            self.entity_count -= 1
+            self._dirty = True
+
+        self._async_set_status(entity_id, new_state.state if new_state else None)
+
+    @callback
+    def _async_entry_changed(self, change: ConfigEntryChange, entry: ConfigEntry):
+        """Update the failed config entries after an entry changed."""
+        if change == ConfigEntryChange.REMOVED:
+            if self._failed_entries.pop(entry.entry_id, None) is not None:
+                self._dirty = True
+            return
+        self._async_set_entry_state(entry)
+
+    @callback
+    def _async_set_status(self, entity_id, state):
+        """Move an entity between problem states, adjusting the counters."""
+        status = state if state in PROBLEM_STATES else None
+        previous = self._problems.get(entity_id)
+
+        if previous is None and status is None:
+            return
+        if previous is not None and previous[0] == status:
+            return
+
+        if previous is not None:
+            old_status, domain, integration = previous
+            self._domains[domain][old_status] -= 1
+            self._integrations[integration][old_status] -= 1
+            del self._problems[entity_id]
+
+        if status is not None:
+            domain = entity_id.split(".", 1)[0]
+            entry = self._registry.async_get(entity_id) if self._registry else None
+            integration = entry.platform if entry is not None else domain
+            self._domains[domain][status] += 1
+            self._integrations[integration][status] += 1
+            self._problems[entity_id] = (status, domain, integration)
+
+        self._dirty = True
+
+    @callback
+    def _async_set_entry_state(self, entry: ConfigEntry):
+        """Track whether a config entry is in a failed state."""
+        if entry.state in FAILED_ENTRY_STATES:
+            self._failed_entries[entry.entry_id] = (entry.domain, entry.title, entry.state.value)
+            self._dirty = True
+        elif self._failed_entries.pop(entry.entry_id, None) is not None:
+            self._dirty = True
+
+    @callback
+    def _async_rebuild(self):
+        """Rebuild the cached summaries if anything changed since last time."""
+        if not self._dirty:
+            return
+
+        services = []
+        for integration, counts in sorted(self._integrations.items()):
+            # Buttons, scenes and the like are unknown until first used, so
+            # only unavailable entities mark an integration as a problem
+            if not counts[STATE_UNAVAILABLE]:
+                continue
+            services.append({
+                "name": integration,
+                "type": "integration",
+                "status": "unavailable",
+                "unavailable": counts[STATE_UNAVAILABLE],
+                "unknown": counts[STATE_UNKNOWN],
+            })
+        for entry_id, (domain, title, state) in sorted(self._failed_entries.items()):
+            services.append({
+                "name": domain,
+                "type": "config_entry",
+                "status": state,
+                "entry_id": entry_id,
+                "title": title,
+            })
+
+        self._services = services
+        self._entity_health = {
+            "entities": self.entity_count,
+            "unavailable": sum(c[STATE_UNAVAILABLE] for c in self._domains.values()),
+            "unknown": sum(c[STATE_UNKNOWN] for c in self._domains.values()),
+            "domains": {
+                domain: dict(counts)
+                for domain, counts in sorted(self._domains.items())
+                if counts[STATE_UNAVAILABLE] or counts[STATE_UNKNOWN]
+            },
+        }
+        self._dirty = False
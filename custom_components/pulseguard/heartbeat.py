@@ -0,0 +1,129 @@
+"""Lightweight heartbeat for the PulseGuard integration."""
+import asyncio
+import logging
+from datetime import timedelta
+
+import aiohttp
+import async_timeout
+
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers.aiohttp_client import async_get_clientsession
+from homeassistant.helpers.event import async_call_later, async_track_time_interval
+
+from .const import HEARTBEAT_UNSUPPORTED_RETRY
+
+_LOGGER = logging.getLogger(__name__)
+
+
+class PulseGuardHeartbeat:
+    """Tell PulseGuard the instance is alive, separately from check-ins.
+
+    A heartbeat carries no metrics and does no collection: it is a single
+    header-only POST over Home Assistant's shared aiohttp session, which
+    keeps the connection alive between beats. While the push channel is
+    connected the heartbeat is sent over the socket instead. If the server
+    has no heartbeat endpoint, offline detection relies on check-ins alone
+    and the heartbeat is tried again every few minutes.
+    """
+
+    def __init__(self, hass: HomeAssistant, api_token, api_url, interval, push_channel=None):
+        """Initialize the heartbeat."""
+        self.hass = hass
+        self.api_token = api_token
+        self.heartbeat_url = f"{api_url.rstrip('/')}/devices/heartbeat"
+        self.interval = interval
+        self.push_channel = push_channel
+        self.error_count = 0
+        self.unsupported = False
+        self._unsub = None
+        self._unsub_retry = None
+        self._pending = None
+
+    @callback
+    def async_start(self):
+        """Start sending heartbeats."""
+        if self._unsub is None:
+            self._unsub = async_track_time_interval(
+                self.hass, self._async_tick, timedelta(seconds=self.interval)
+            )
+
+    @callback
+    def async_stop(self):
+        """Stop sending heartbeats."""
+        self._async_stop_timer()
+        if self._unsub_retry is not None:
+            self._unsub_retry()
+            self._unsub_retry = None
+        if self._pending is not None:
+            self._pending.cancel()
+            self._pending = None
+
+    @callback
+    def _async_stop_timer(self):
+        """Stop scheduling new heartbeats."""
+        if self._unsub is not None:
+            self._unsub()
+            self._unsub = None
+
+    @callback
+    def _async_retry(self, now=None):
+        """Try the heartbeat endpoint again after backing off."""
+        self._unsub_retry = None
+        self.async_start()
+        self._async_tick()
+
+    @callback
+    def _async_tick(self, now=None):
+        """Send a heartbeat unless the previous one is still in flight."""
+        if self._pending is not None and not self._pending.done():
+            return
+        self._pending = self.hass.async_create_task(self._async_beat())
+
+    async def _async_beat(self):
+        """Send a single heartbeat."""
+        if self.push_channel is not None and self.push_channel.connected:
+            if await self.push_channel.async_send({"type": "heartbeat"}):
+                return
+
+        session = async_get_clientsession(self.hass)
+        try:
+            async with async_timeout.timeout(self.interval):
+                async with session.post(
+                    self.heartbeat_url, headers={"X-API-Token": self.api_token}
+                ) as response:
+                    if response.status in (404, 405):
+                        self._async_back_off(response.status)
+                        return
+                    response.raise_for_status()
+        except (aiohttp.ClientError, asyncio.TimeoutError) as err:
+            self.error_count += 1
+            # Only log every 10 errors, heartbeats are frequent
+            if self.error_count == 1 or self.error_count % 10 == 0:
+                _LOGGER.warning("Error #%d sending heartbeat to PulseGuard API: %s", self.error_count, err)
+            return
+
+        if self.unsupported:
+            _LOGGER.info("PulseGuard API accepts heartbeats again")
+            self.unsupported = False
+        if self.error_count > 0:
+            _LOGGER.info("Heartbeat to PulseGuard API recovered after %d errors", self.error_count)
+            self.error_count = 0
+
+    @callback
+    def _async_back_off(self, status):
+        """Pause the heartbeat on a server without a heartbeat endpoint."""
+        # A proxy or a deploy can answer 404 for a while, so try again later
+        # instead of giving up for good; only warn when it starts
+        if not self.unsupported:
+            _LOGGER.warning(
+                "PulseGuard API does not support heartbeats (HTTP %s), relying on "
+                "check-ins and trying again in %d seconds",
+                status,
+                HEARTBEAT_UNSUPPORTED_RETRY,
+            )
+            self.unsupported = True
+        self._async_stop_timer()
+        if self._unsub_retry is None:
+            self._unsub_retry = async_call_later(
+                self.hass, HEARTBEAT_UNSUPPORTED_RETRY, self._async_retry
+            )
@@ -0,0 +1,197 @@
+"""Persistent push channel for the PulseGuard integration."""
+import asyncio
+import json
+import logging
+from contextlib import suppress
+from datetime import timedelta
+
+import aiohttp
+import async_timeout
+
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.core import HomeAssistant
+from homeassistant.helpers.aiohttp_client import async_get_clientsession
+
+from .const import (
+    PUSH_ACK_TIMEOUT,
+    PUSH_MAX_MISSED_ACKS,
+    PUSH_MAX_UPDATE_INTERVAL,
+    PUSH_MIN_UPDATE_INTERVAL,
+    PUSH_PING_INTERVAL,
+    PUSH_RECONNECT_MAX,
+    PUSH_RECONNECT_MIN,
+)
+
+_LOGGER = logging.getLogger(__name__)
+
+
+def get_stream_url(api_url, device_uuid):
+    """Return the WebSocket URL of the push channel for a device."""
+    url = api_url.rstrip("/")
+    if url.startswith("https://"):
+        url = "wss://" + url[len("https://"):]
+    elif url.startswith("http://"):
+        url = "ws://" + url[len("http://"):]
+    return f"{url}/devices/{device_uuid}/stream"
+
+
+class PulseGuardPushChannel:
+    """Long-lived WebSocket connection to the PulseGuard API.
+
+    The server uses this channel to send commands to the device, and the
+    coordinator streams check-ins over it while it is connected. A streamed
+    check-in only counts as delivered once the server acknowledges it. When
+    the socket is down, or the server stops acknowledging check-ins, the
+    coordinator posts them over HTTP instead.
+    """
+
+    def __init__(self, hass: HomeAssistant, coordinator, api_token, device_uuid, api_url):
+        """Initialize the push channel."""
+        self.hass = hass
+        self.coordinator = coordinator
+        self.api_token = api_token
+        self.device_uuid = device_uuid
+        self.stream_url = get_stream_url(api_url, device_uuid)
+        self._ws = None
+        self._task = None
+        self._sequence = 0
+        # sequence id -> future resolved with True on ack, False on disconnect
+        self._pending_acks = {}
+        self._missed_acks = 0
+        self._reconnect_delay = PUSH_RECONNECT_MIN
+
+    @property
+    def connected(self):
+        """Return True if the WebSocket is open."""
+        return self._ws is not None and not self._ws.closed
+
+    def async_start(self, entry: ConfigEntry):
+        """Start the background task that keeps the channel connected."""
+        if self._task is None:
+            self._task = entry.async_create_background_task(
+                self.hass, self._async_run(), name="pulseguard push channel"
+            )
+
+    async def async_stop(self):
+        """Close the channel and stop reconnecting."""
+        task, self._task = self._task, None
+        if task is not None:
+            task.cancel()
+            with suppress(asyncio.CancelledError):
+                await task
+        if self._ws is not None:
+            await self._ws.close()
+            self._ws = None
+
+    async def async_send(self, message):
+        """Send a message over the channel, return False if it was not sent."""
+        if not self.connected:
+            return False
+        try:
+            await self._ws.send_json(message)
+        except (aiohttp.ClientError, ConnectionResetError, RuntimeError) as err:
+            _LOGGER.debug("Could not send over PulseGuard push channel: %s", err)
+            return False
+        return True
+
+    async def async_send_check_in(self, data):
+        """Stream a check-in, return True once the server acknowledged it."""
+        if not self.connected or self._missed_acks >= PUSH_MAX_MISSED_ACKS:
+            return False
+
+        self._sequence += 1
+        sequence = self._sequence
+        ack = self.hass.loop.create_future()
+        self._pending_acks[sequence] = ack
+        try:
+            if not await self.async_send({"type": "check-in", "id": sequence, "data": data}):
+                return False
+            async with async_timeout.timeout(PUSH_ACK_TIMEOUT):
+                delivered = await ack
+        except asyncio.TimeoutError:
+            self._missed_acks += 1
+            if self._missed_acks == PUSH_MAX_MISSED_ACKS:
+                _LOGGER.warning(
+                    "PulseGuard server is not acknowledging check-ins on the push "
+                    "channel, posting them over HTTP until it reconnects"
+                )
+            return False
+        finally:
+            self._pending_acks.pop(sequence, None)
+
+        if delivered:
+            self._missed_acks = 0
+        return delivered
+
+    async def _async_run(self):
+        """Connect to the server and reconnect with backoff when dropped."""
+        session = async_get_clientsession(self.hass)
+        headers = {"X-API-Token": self.api_token}
+
+        while True:
+            try:
+                async with session.ws_connect(
+                    self.stream_url, headers=headers, heartbeat=PUSH_PING_INTERVAL
+                ) as ws:
+                    self._ws = ws
+                    self._missed_acks = 0
+                    self._reconnect_delay = PUSH_RECONNECT_MIN
+                    _LOGGER.info("Connected to PulseGuard push channel")
+
+                    async for msg in ws:
+                        if msg.type == aiohttp.WSMsgType.TEXT:
+                            # A message we fail to handle must not end the channel
+                            try:
+                                await self._async_handle_message(msg.data)
+                            except Exception:  # pylint: disable=broad-except
+                                _LOGGER.exception("Error handling push message: %s", msg.data)
+                        elif msg.type == aiohttp.WSMsgType.ERROR:
+                            break
+
+                _LOGGER.info("PulseGuard push channel closed, falling back to polling")
+            except (aiohttp.ClientError, asyncio.TimeoutError) as err:
+                # Servers without push support end up here too; polling keeps
+                # working and we retry with an increasing delay
+                _LOGGER.debug("PulseGuard push channel unavailable: %s", err)
+            finally:
+                self._ws = None
+                # Check-ins still waiting for an ack were not delivered
+                for ack in self._pending_acks.values():
+                    if not ack.done():
+                        ack.set_result(False)
+
+            await asyncio.sleep(self._reconnect_delay)
+            self._reconnect_delay = min(self._reconnect_delay * 2, PUSH_RECONNECT_MAX)
+
+    async def _async_handle_message(self, raw):
+        """Handle a command sent by the server."""
+        try:
+            message = json.loads(raw)
+            command = message["type"]
+        except (ValueError, TypeError, KeyError):
+            _LOGGER.warning("Ignoring malformed push message: %s", raw)
+            return
+
+        if command == "sample":
+            # Take a sample right away instead of waiting for the next tick.
+            # Not awaited: the check-in waits for an ack this loop has to read
+            self.hass.async_create_task(self.coordinator.async_request_check_in())
+        elif command == "set_interval":
+            try:
+                seconds = int(message["seconds"])
+            except (KeyError, TypeError, ValueError, OverflowError):
+                _LOGGER.warning("Ignoring invalid interval in push message: %s", raw)
+                return
+            seconds = max(PUSH_MIN_UPDATE_INTERVAL, min(seconds, PUSH_MAX_UPDATE_INTERVAL))
+            _LOGGER.debug("PulseGuard server set update interval to %d seconds", seconds)
+            self.coordinator.update_interval = timedelta(seconds=seconds)
+        elif command == "ack":
+            sequence = message.get("id")
+            if not isinstance(sequence, int):
+                _LOGGER.warning("Ignoring ack with invalid id in push message: %s", raw)
+                return
+            ack = self._pending_acks.get(sequence)
+            if ack is not None and not ack.done():
+                ack.set_result(True)
+        else:
+            _LOGGER.debug("Ignoring unknown push command: %s", command)
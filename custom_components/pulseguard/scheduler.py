@@ -0,0 +1,104 @@
+"""Adaptive check-in scheduling for the PulseGuard integration."""
+import logging
+import time
+
+from .const import (
+    ADAPTIVE_ALERT_LEVEL,
+    ADAPTIVE_CHANGE_THRESHOLD,
+    ADAPTIVE_SMOOTHING,
+    ADAPTIVE_VOLATILITY_THRESHOLD,
+    ATTR_CPU_USAGE,
+    ATTR_DISK_USAGE,
+    ATTR_MEMORY_USAGE,
+)
+
+_LOGGER = logging.getLogger(__name__)
+
+# Metrics (all percentages) that drive the upload interval
+TRACKED_METRICS = (ATTR_CPU_USAGE, ATTR_MEMORY_USAGE, ATTR_DISK_USAGE)
+
+# Metrics that tighten the interval when close to an alert level
+ALERT_METRICS = (ATTR_CPU_USAGE, ATTR_MEMORY_USAGE)
+
+
+class PulseGuardUploadScheduler:
+    """Decide when a sample has to be uploaded to PulseGuard.
+
+    The coordinator keeps sampling at its normal update interval so sensors
+    stay accurate. This scheduler only decides which of those samples are
+    sent. While the metrics are stable the upload interval doubles after
+    every upload, up to the maximum heartbeat period. It drops back to the
+    sampling interval as soon as the metrics become volatile, or CPU or
+    memory get close to an alert level. A sudden jump since the last upload
+    is sent right away. An upload only counts once it has been recorded, so
+    a failed check-in is retried on the next sample.
+    """
+
+    def __init__(self, max_interval):
+        """Initialize the scheduler."""
+        self.max_interval = max_interval
+        self.interval = None
+        self.volatility = 0.0
+        self.last_upload_time = None
+        self._last_uploaded = None
+        self._last_sample = None
+        self._busy = False
+        self._force = False
+
+    def request_upload(self):
+        """Make sure the next sample is uploaded."""
+        self._force = True
+
+    def should_upload(self, metrics, min_interval, now=None):
+        """Record a sample and return True if it should be uploaded."""
+        if now is None:
+            now = time.monotonic()
+        if self.interval is None:
+            self.interval = min_interval
+
+        # Exponentially weighted average of the change between samples
+        if self._last_sample is not None:
+            delta = _max_delta(metrics, self._last_sample)
+            self.volatility = (
+                ADAPTIVE_SMOOTHING * delta + (1 - ADAPTIVE_SMOOTHING) * self.volatility
+            )
+        self._last_sample = metrics
+
+        # Disk usage barely moves, so a full disk must not keep the
+        # scheduler busy forever; only CPU and memory count for proximity
+        self._busy = self.volatility >= ADAPTIVE_VOLATILITY_THRESHOLD or any(
+            metrics.get(key, 0) >= ADAPTIVE_ALERT_LEVEL for key in ALERT_METRICS
+        )
+        if self._busy:
+            self.interval = min_interval
+
+        return (
+            self._force
+            or self._last_uploaded is None
+            # Allow half a tick of slack so scheduling jitter can't skip a tick
+            or now - self.last_upload_time >= self.interval - min_interval / 2
+            or _max_delta(metrics, self._last_uploaded) >= ADAPTIVE_CHANGE_THRESHOLD
+        )
+
+    def record_upload(self, metrics, min_interval, now=None):
+        """Record that a sample was delivered and stretch the interval."""
+        if now is None:
+            now = time.monotonic()
+
+        if not self._busy:
+            self.interval = min(self.interval * 2, max(self.max_interval, min_interval))
+        _LOGGER.debug(
+            "Uploaded sample, next upload within %d seconds (volatility %.1f)",
+            self.interval,
+            self.volatility,
+        )
+        self._force = False
+        self._last_uploaded = metrics
+        self.last_upload_time = now
+
+
+def _max_delta(metrics, previous):
+    """Return the largest change of a tracked metric between two samples."""
+    return max(
+        abs(metrics.get(key, 0) - previous.get(key, 0)) for key in TRACKED_METRICS
+    )
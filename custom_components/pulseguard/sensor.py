@@ -26,10 +26,14 @@ from .const import (
     ATTR_MEMORY_USAGE,
     ATTR_UPTIME,
     DOMAIN,
+    SENSOR_NAME_ADDON_CPU,
+    SENSOR_NAME_ADDON_MEMORY,
     SENSOR_NAME_CPU,
     SENSOR_NAME_DISK,
     SENSOR_NAME_MEMORY,
     SENSOR_NAME_UPTIME,
+    SENSOR_TYPE_ADDON_CPU,
+    SENSOR_TYPE_ADDON_MEMORY,
     SENSOR_TYPE_CPU,
     SENSOR_TYPE_DISK,
     SENSOR_TYPE_MEMORY,
@@ -56,6 +60,29 @@ async def async_setup_entry(
     ]
     
     async_add_entities(sensors)
+    
+    # Add-on sensors are created as add-ons show up in the Supervisor stats
+    if coordinator.supervisor_stats is not None:
+        known_addons = set()
+        
+        @callback
+        def _async_add_addon_sensors() -> None:
+            """Add sensors for add-ons that don't have them yet."""
+            addons = (coordinator.data or {}).get("addons", {})
+            new_sensors = []
+            for slug, stats in addons.items():
+                if slug in known_addons:
+                    continue
+                known_addons.add(slug)
+                new_sensors += [
+                    PulseGuardAddonCpuSensor(coordinator, device_uuid, slug, stats["name"]),
+                    PulseGuardAddonMemorySensor(coordinator, device_uuid, slug, stats["name"]),
+                ]
+            if new_sensors:
+                async_add_entities(new_sensors)
+        
+        _async_add_addon_sensors()
+        entry.async_on_unload(coordinator.async_add_listener(_async_add_addon_sensors))
 
 
 class PulseGuardSensor(CoordinatorEntity, SensorEntity):
@@ -208,4 +235,87 @@ class PulseGuardUptimeSensor(PulseGuardSensor):
         
         return {
             "human_readable": uptime_human,
-        } 
\ No newline at end of file
+        }
+
+
+class PulseGuardAddonSensor(PulseGuardSensor):
+    """Base class for add-on resource sensors."""
+
+    # Optional sensors, users enable the ones they care about
+    _attr_entity_registry_enabled_default = False
+
+    def __init__(
+        self,
+        coordinator: PulseGuardCoordinator,
+        device_uuid: str,
+        slug: str,
+        addon_name: str,
+        sensor_type: str,
+        name: str,
+        key: str,
+    ) -> None:
+        """Initialize the add-on sensor."""
+        super().__init__(
+            coordinator, device_uuid, f"{sensor_type}_{slug}", f"{addon_name} {name}"
+        )
+        self._slug = slug
+        self._key = key
+        self._attr_native_unit_of_measurement = PERCENTAGE
+    
+    @property
+    def available(self) -> bool:
+        """Return True if the add-on is running and has stats."""
+        return (
+            super().available
+            and self._slug in (self.coordinator.data or {}).get("addons", {})
+        )
+    
+    @property
+    def native_value(self) -> StateType:
+        """Return the state of the sensor."""
+        if not self.coordinator.data:
+            return None
+        
+        # Get add-on stats from coordinator data
+        addon = self.coordinator.data.get("addons", {}).get(self._slug)
+        if addon is None:
+            return None
+        return addon.get(self._key)
+
+
+class PulseGuardAddonCpuSensor(PulseGuardAddonSensor):
+    """Sensor for the CPU usage of an add-on."""
+
+    def __init__(
+        self, coordinator: PulseGuardCoordinator, device_uuid: str, slug: str, addon_name: str
+    ) -> None:
+        """Initialize the add-on CPU sensor."""
+        super().__init__(
+            coordinator,
+            device_uuid,
+            slug,
+            addon_name,
+            SENSOR_TYPE_ADDON_CPU,
+            SENSOR_NAME_ADDON_CPU,
+            ATTR_CPU_USAGE,
+        )
+        self._attr_icon = "mdi:cpu-64-bit"
+
+
+class PulseGuardAddonMemorySensor(PulseGuardAddonSensor):
+    """Sensor for the memory usage of an add-on."""
+
+    def __init__(
+        self, coordinator: PulseGuardCoordinator, device_uuid: str, slug: str, addon_name: str
+    ) -> None:
+        """Initialize the add-on memory sensor."""
+        super().__init__(
+            coordinator,
+            device_uuid,
+            slug,
+            addon_name,
+            SENSOR_TYPE_ADDON_MEMORY,
+            SENSOR_NAME_ADDON_MEMORY,
+            ATTR_MEMORY_USAGE,
+        )
+        self._attr_icon = "mdi:memory"
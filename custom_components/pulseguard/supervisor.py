@@ -0,0 +1,155 @@
+"""Per add-on resource metrics from the Home Assistant Supervisor."""
+import asyncio
+import logging
+import os
+import time
+
+import aiohttp
+import async_timeout
+
+from homeassistant.core import HomeAssistant
+from homeassistant.helpers.aiohttp_client import async_get_clientsession
+
+from .const import (
+    SUPERVISOR_ADDONS_TTL,
+    SUPERVISOR_MAX_CONCURRENCY,
+    SUPERVISOR_MAX_FETCHES,
+    SUPERVISOR_STATS_TTL,
+    SUPERVISOR_TIMEOUT,
+    SUPERVISOR_UPDATE_TIMEOUT,
+)
+
+_LOGGER = logging.getLogger(__name__)
+
+# Errors from an unreachable Supervisor, and from responses that aren't
+# shaped the way we expect; either way the cached stats are kept
+FETCH_ERRORS = (
+    aiohttp.ClientError,
+    asyncio.TimeoutError,
+    ValueError,
+    TypeError,
+    AttributeError,
+    KeyError,
+)
+
+
+class PulseGuardSupervisorStats:
+    """Collect CPU, memory and network usage of running add-ons.
+
+    Requests go through Home Assistant's shared aiohttp session, so they
+    reuse pooled connections to the Supervisor. Every add-on keeps its last
+    stats for a while. Each update only refreshes a limited number of the
+    stalest entries, with a limited number of requests in flight, so dozens
+    of add-ons don't cause a burst of requests on every tick. An update never
+    takes longer than its own deadline; a slow Supervisor only means older
+    cached stats.
+    """
+
+    def __init__(self, hass: HomeAssistant, supervisor_url, token):
+        """Initialize the collector."""
+        self.hass = hass
+        self.supervisor_url = supervisor_url.rstrip("/")
+        self.token = token
+        self._addons = {}
+        self._addons_time = None
+        # slug -> (fetch time, stats)
+        self._stats = {}
+        self._semaphore = asyncio.Semaphore(SUPERVISOR_MAX_CONCURRENCY)
+
+    @classmethod
+    def from_env(cls, hass: HomeAssistant):
+        """Return a collector if Home Assistant runs under the Supervisor."""
+        host = os.environ.get("SUPERVISOR")
+        token = os.environ.get("SUPERVISOR_TOKEN")
+        if not host or not token:
+            return None
+        return cls(hass, f"http://{host}", token)
+
+    async def async_update(self):
+        """Refresh the stalest add-on stats and return stats for all add-ons."""
+        try:
+            async with async_timeout.timeout(SUPERVISOR_UPDATE_TIMEOUT):
+                await self._async_refresh()
+        except asyncio.TimeoutError:
+            _LOGGER.debug("Supervisor is slow, using cached add-on stats")
+
+        return {
+            slug: {"name": self._addons[slug], **stats}
+            for slug, (_, stats) in sorted(self._stats.items())
+            if slug in self._addons
+        }
+
+    async def _async_refresh(self):
+        """Refresh the add-on list when due and the stalest add-on stats."""
+        session = async_get_clientsession(self.hass)
+        now = time.monotonic()
+
+        # After a failed fetch the list is retried on the next update
+        if self._addons_time is None or now - self._addons_time >= SUPERVISOR_ADDONS_TTL:
+            if await self._async_update_addons(session):
+                self._addons_time = now
+
+        # Forget add-ons that were removed or stopped
+        for slug in list(self._stats):
+            if slug not in self._addons:
+                del self._stats[slug]
+
+        stale = sorted(
+            (
+                slug
+                for slug in self._addons
+                if slug not in self._stats or now - self._stats[slug][0] >= SUPERVISOR_STATS_TTL
+            ),
+            key=lambda slug: self._stats[slug][0] if slug in self._stats else 0,
+        )[:SUPERVISOR_MAX_FETCHES]
+
+        if stale:
+            await asyncio.gather(
+                *(self._async_update_stats(session, slug) for slug in stale)
+            )
+
+    async def _async_get(self, session, path):
+        """Return the data of a Supervisor API response."""
+        async with self._semaphore:
+            async with async_timeout.timeout(SUPERVISOR_TIMEOUT):
+                async with session.get(
+                    f"{self.supervisor_url}{path}",
+                    headers={"Authorization": f"Bearer {self.token}"},
+                ) as response:
+                    response.raise_for_status()
+                    result = await response.json()
+        return result.get("data", {})
+
+    async def _async_update_addons(self, session):
+        """Refresh the list of running add-ons, return True on success."""
+        try:
+            data = await self._async_get(session, "/addons")
+            addons = {
+                addon["slug"]: addon.get("name", addon["slug"])
+                for addon in data.get("addons", [])
+                if addon.get("state") == "started"
+            }
+        except FETCH_ERRORS as err:
+            _LOGGER.warning("Error fetching add-ons from the Supervisor: %s", err)
+            return False
+
+        self._addons = addons
+        return True
+
+    async def _async_update_stats(self, session, slug):
+        """Refresh the stats of a single add-on."""
+        try:
+            data = await self._async_get(session, f"/addons/{slug}/stats")
+            stats = {
+                "cpu_usage": round(data.get("cpu_percent", 0), 1),
+                "memory_usage": round(data.get("memory_percent", 0), 1),
+                "memory_used": int(data.get("memory_usage", 0)) // (1024 * 1024),  # Convert to MB
+                "network_rx": data.get("network_rx", 0),
+                "network_tx": data.get("network_tx", 0),
+            }
+        except FETCH_ERRORS as err:
+            # Keep serving the cached stats until the next attempt
+            _LOGGER.debug("Error fetching stats for add-on %s: %s", slug, err)
+            return
+
+        self._stats[slug] = (time.monotonic(), stats)
@@ -0,0 +1,160 @@
+"""Dedicated worker pool for blocking PulseGuard work."""
+import logging
+import time
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+
+from homeassistant.const import EVENT_HOMEASSISTANT_STOP
+from homeassistant.core import Event, HomeAssistant, callback
+from homeassistant.exceptions import HomeAssistantError
+
+from .const import DATA_WORKER_POOL, WORKER_MAX_QUEUE, WORKER_MAX_THREADS
+
+_LOGGER = logging.getLogger(__name__)
+
+# Smoothing factor for the average queue wait time
+WAIT_TIME_SMOOTHING = 0.2
+
+
+@callback
+def async_get_worker_pool(hass: HomeAssistant):
+    """Return the worker pool shared by all PulseGuard entries."""
+    pool = hass.data.get(DATA_WORKER_POOL)
+    if pool is None:
+        pool = hass.data[DATA_WORKER_POOL] = PulseGuardWorkerPool(hass)
+
+        @callback
+        def _async_shutdown(event: Event) -> None:
+            """Shut the pool down when Home Assistant stops."""
+            hass.data.pop(DATA_WORKER_POOL, None)
+            pool.async_shutdown()
+
+        hass.bus.async_listen_once(EVENT_HOMEASSISTANT_STOP, _async_shutdown)
+    return pool
+
+
+class PulseGuardWorkerPool:
+    """Small bounded thread pool for blocking PulseGuard work.
+
+    Blocking calls run on a few threads of their own, so a hung psutil call,
+    disk query or HTTP request can only hold up PulseGuard and never Home
+    Assistant's shared executor. Jobs wait in a bounded queue until a thread
+    is free. When the queue is full the oldest droppable job is discarded,
+    which suits collection jobs whose sample would be stale anyway.
+    """
+
+    def __init__(self, hass: HomeAssistant, max_workers=WORKER_MAX_THREADS, max_queue=WORKER_MAX_QUEUE):
+        """Initialize the worker pool."""
+        self.hass = hass
+        self.max_workers = max_workers
+        self.max_queue = max_queue
+        self.running = 0
+        self.dropped = 0
+        self.wait_time_last = 0.0
+        self.wait_time_avg = 0.0
+        self.wait_time_max = 0.0
+        self._queue = deque()
+        self._executor = ThreadPoolExecutor(
+            max_workers=max_workers, thread_name_prefix="pulseguard"
+        )
+
+    @property
+    def stats(self):
+        """Return queue and wait time metrics (wait times in milliseconds)."""
+        self._async_prune()
+        return {
+            "queue_depth": len(self._queue),
+            "running": self.running,
+            "dropped": self.dropped,
+            "wait_time_last": round(self.wait_time_last * 1000, 1),
+            "wait_time_avg": round(self.wait_time_avg * 1000, 1),
+            "wait_time_max": round(self.wait_time_max * 1000, 1),
+        }
+
+    async def async_run(self, func, *args, droppable=False):
+        """Run a blocking function on the pool and return its result."""
+        future = self.hass.loop.create_future()
+
+        # Jobs whose caller gave up don't take up room in the queue
+        self._async_prune()
+        if len(self._queue) >= self.max_queue:
+            self._async_drop_oldest()
+
+        self._queue.append((future, func, args, droppable, time.monotonic()))
+        self._async_dispatch()
+        return await future
+
+    @callback
+    def async_shutdown(self):
+        """Fail queued jobs and stop the threads without waiting for them."""
+        while self._queue:
+            future = self._queue.popleft()[0]
+            if not future.done():
+                future.set_exception(WorkerPoolClosed("PulseGuard worker pool is shut down"))
+        self._executor.shutdown(wait=False)
+
+    @callback
+    def _async_prune(self):
+        """Remove queued jobs whose caller already gave up."""
+        if any(job[0].done() for job in self._queue):
+            self._queue = deque(job for job in self._queue if not job[0].done())
+
+    @callback
+    def _async_drop_oldest(self):
+        """Make room in the queue by dropping the oldest droppable job."""
+        for job in self._queue:
+            if job[3]:
+                self._queue.remove(job)
+                self.dropped += 1
+                _LOGGER.warning(
+                    "PulseGuard worker queue is full, dropping stale %s job", job[1].__name__
+                )
+                if not job[0].done():
+                    job[0].set_exception(WorkerJobDropped("Job dropped from a full queue"))
+                return
+        raise WorkerQueueFull(f"PulseGuard worker queue is full ({self.max_queue} jobs)")
+
+    @callback
+    def _async_dispatch(self):
+        """Start queued jobs while there are free threads."""
+        while self.running < self.max_workers and self._queue:
+            future, func, args, _, queued_at = self._queue.popleft()
+            if future.done():
+                # The caller gave up (timeout or cancel) while the job was queued
+                continue
+
+            wait_time = time.monotonic() - queued_at
+            self.wait_time_last = wait_time
+            self.wait_time_max = max(self.wait_time_max, wait_time)
+            self.wait_time_avg = (
+                WAIT_TIME_SMOOTHING * wait_time + (1 - WAIT_TIME_SMOOTHING) * self.wait_time_avg
+            )
+
+            self.running += 1
+            job = self.hass.loop.run_in_executor(self._executor, func, *args)
+            job.add_done_callback(lambda job, future=future: self._async_job_done(future, job))
+
+    @callback
+    def _async_job_done(self, future, job):
+        """Pass the job result to the caller and start the next job."""
+        self.running -= 1
+        if not future.done():
+            if job.cancelled():
+                future.cancel()
+            elif job.exception() is not None:
+                future.set_exception(job.exception())
+            else:
+                future.set_result(job.result())
+        self._async_dispatch()
+
+
+class WorkerJobDropped(HomeAssistantError):
+    """Error to indicate a queued job was dropped to make room."""
+
+
+class WorkerQueueFull(HomeAssistantError):
+    """Error to indicate the queue is full of jobs that can't be dropped."""
+
+
+class WorkerPoolClosed(HomeAssistantError):
+    """Error to indicate the worker pool is shut down."""
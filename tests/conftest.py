@@ -0,0 +1,20 @@
+"""Fixtures for PulseGuard tests."""
+import pytest
+
+from custom_components.pulseguard.const import DATA_WORKER_POOL
+
+
+@pytest.fixture(autouse=True)
+def auto_enable_custom_integrations(enable_custom_integrations):
+    """Enable custom integrations in all tests."""
+    yield
+
+
+@pytest.fixture(autouse=True)
+async def join_worker_pool(hass):
+    """Wait for the worker pool threads so no threads are left behind."""
+    yield
+    pool = hass.data.pop(DATA_WORKER_POOL, None)
+    if pool is not None:
+        pool.async_shutdown()
+        await hass.async_add_executor_job(pool._executor.shutdown)
@@ -0,0 +1,40 @@
+"""Tests for the PulseGuard config flow."""
+import threading
+from unittest.mock import MagicMock, patch
+
+import pytest
+import requests
+
+from custom_components.pulseguard.config_flow import CannotConnect, validate_input
+from custom_components.pulseguard.const import CONF_API_TOKEN, CONF_API_URL, CONF_DEVICE_UUID
+
+USER_INPUT = {
+    CONF_DEVICE_UUID: "914759c0-bcec-43be-a2b6-3d6f7bf67749",
+    CONF_API_TOKEN: "apitoken123456",
+    CONF_API_URL: "http://localhost/api",
+}
+
+
+async def test_validate_input_off_the_event_loop(hass):
+    """Test system info is collected and posted on the worker pool."""
+    threads = []
+
+    def _disk_usage(path):
+        threads.append(threading.current_thread().name)
+        return MagicMock(percent=50.0)
+
+    with patch("psutil.disk_usage", side_effect=_disk_usage), patch(
+        "requests.post", return_value=MagicMock(status_code=200)
+    ) as post:
+        assert await validate_input(hass, USER_INPUT) == USER_INPUT
+
+    assert threads[0].startswith("pulseguard")
+    assert post.call_args.kwargs["json"]["disk_usage"] == 50.0
+
+
+async def test_validate_input_cannot_connect(hass):
+    """Test a failed request is reported as a connection error."""
+    with patch("requests.post", side_effect=requests.exceptions.ConnectionError), pytest.raises(
+        CannotConnect
+    ):
+        await validate_input(hass, USER_INPUT)
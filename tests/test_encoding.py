@@ -0,0 +1,99 @@
+"""Tests for the PulseGuard check-in encoding."""
+import logging
+from unittest.mock import MagicMock, call, patch
+
+import msgpack
+import pytest
+
+from custom_components.pulseguard import PulseGuardCoordinator
+from custom_components.pulseguard.encoding import (
+    CONTENT_TYPE_JSON,
+    CONTENT_TYPE_MSGPACK,
+    PulseGuardPayloadEncoder,
+    columnize,
+    encode_payload,
+)
+
+CHECK_IN = {
+    "metrics": {"cpu_usage": 1.0, "memory_usage": 2.0, "disk_usage": 3.0, "uptime": 4},
+    "services": [
+        {"name": "sensor", "status": "unavailable"},
+        {"name": "light", "status": "unavailable"},
+    ],
+}
+
+
+def _response(status, content_type=CONTENT_TYPE_JSON):
+    """Return a stand-in for a requests response."""
+    return MagicMock(status_code=status, headers={"Content-Type": content_type})
+
+
+@pytest.fixture
+def coordinator(hass):
+    """Return a coordinator that negotiates the check-in encoding."""
+    coordinator = PulseGuardCoordinator(
+        hass,
+        logging.getLogger(__name__),
+        api_token="token",
+        device_uuid="uuid",
+        api_url="http://localhost",
+    )
+    coordinator.payload_encoder = PulseGuardPayloadEncoder()
+    return coordinator
+
+
+def test_columnize():
+    """Test lists of uniform records are stored by column."""
+    assert columnize(CHECK_IN)["services"] == {
+        "_columns": {"name": ["sensor", "light"], "status": ["unavailable", "unavailable"]}
+    }
+    # Records with different keys are left alone
+    assert columnize([{"a": 1}, {"b": 2}]) == [{"a": 1}, {"b": 2}]
+    assert msgpack.unpackb(encode_payload(CHECK_IN, CONTENT_TYPE_MSGPACK)) == columnize(CHECK_IN)
+
+
+async def test_switches_to_msgpack(hass, coordinator):
+    """Test check-ins switch to MessagePack once the server answers with it."""
+    encoder = coordinator.payload_encoder
+    with patch.object(
+        coordinator,
+        "_send_check_in",
+        side_effect=[_response(200, CONTENT_TYPE_MSGPACK), _response(200, CONTENT_TYPE_MSGPACK)],
+    ) as send:
+        assert await coordinator._async_send_check_in(CHECK_IN)
+        assert await coordinator._async_send_check_in(CHECK_IN)
+
+    assert send.call_args_list == [
+        call(CHECK_IN, CONTENT_TYPE_JSON, encoder.accept),
+        call(CHECK_IN, CONTENT_TYPE_MSGPACK, encoder.accept),
+    ]
+
+
+async def test_refused_msgpack_is_retried_as_json(hass, coordinator):
+    """Test a 415 answer resends the check-in as JSON and stays on JSON."""
+    encoder = coordinator.payload_encoder
+    encoder.content_type = CONTENT_TYPE_MSGPACK
+    with patch.object(
+        coordinator,
+        "_send_check_in",
+        side_effect=[_response(415), _response(200), _response(200, CONTENT_TYPE_MSGPACK)],
+    ) as send:
+        assert await coordinator._async_send_check_in(CHECK_IN)
+        assert await coordinator._async_send_check_in(CHECK_IN)
+
+    assert [args[1] for args, _ in send.call_args_list] == [
+        CONTENT_TYPE_MSGPACK,
+        CONTENT_TYPE_JSON,
+        CONTENT_TYPE_JSON,
+    ]
+    assert encoder.content_type == CONTENT_TYPE_JSON
+    assert encoder.accept == CONTENT_TYPE_JSON
+
+
+async def test_failed_check_in(hass, coordinator):
+    """Test failed posts are reported without changing the encoding."""
+    with patch.object(coordinator, "_send_check_in", side_effect=[None, _response(500)]):
+        assert not await coordinator._async_send_check_in(CHECK_IN)
+        assert not await coordinator._async_send_check_in(CHECK_IN)
+
+    assert coordinator.payload_encoder.content_type == CONTENT_TYPE_JSON
@@ -0,0 +1,159 @@
+"""Tests for the PulseGuard health index."""
+import pytest
+from pytest_homeassistant_custom_component.common import MockConfigEntry
+
+from homeassistant.config_entries import (
+    SIGNAL_CONFIG_ENTRY_CHANGED,
+    ConfigEntryChange,
+    ConfigEntryState,
+)
+from homeassistant.const import STATE_UNAVAILABLE, STATE_UNKNOWN
+from homeassistant.helpers import entity_registry as er
+from homeassistant.helpers.dispatcher import async_dispatcher_send
+
+from custom_components.pulseguard.health import PulseGuardHealthIndex
+
+
+@pytest.fixture
+def index(hass):
+    """Return a started health index."""
+    index = PulseGuardHealthIndex(hass)
+    index.async_start()
+    yield index
+    index.async_stop()
+
+
+@pytest.fixture
+def entry(hass):
+    """Return a config entry whose state the test sets directly."""
+    entry = MockConfigEntry(domain="hue", title="Bridge")
+    entry.add_to_hass(hass)
+    yield entry
+    # Leave nothing for Home Assistant to unload on teardown
+    entry.mock_state(hass, ConfigEntryState.NOT_LOADED)
+
+
+def _entry_services(index):
+    """Return the failed config entries reported as services."""
+    return [service for service in index.services if service["type"] == "config_entry"]
+
+
+async def test_services_only_list_unavailable(hass):
+    """Test unknown-only domains are counted but not reported as services."""
+    hass.states.async_set("button.restart", STATE_UNKNOWN)
+    hass.states.async_set("sensor.outdoor", STATE_UNAVAILABLE)
+    hass.states.async_set("sensor.indoor", "21.5")
+
+    index = PulseGuardHealthIndex(hass)
+    index.async_start()
+
+    assert [service["name"] for service in index.services] == ["sensor"]
+    assert index.entity_health["entities"] == 3
+    assert index.entity_health["domains"] == {
+        "button": {STATE_UNAVAILABLE: 0, STATE_UNKNOWN: 1},
+        "sensor": {STATE_UNAVAILABLE: 1, STATE_UNKNOWN: 0},
+    }
+
+    # Recovering entities are removed from the summary
+    hass.states.async_set("sensor.outdoor", "12.0")
+    await hass.async_block_till_done()
+    assert index.services == []
+    assert index.entity_health["unavailable"] == 0
+
+    index.async_stop()
+
+
+async def test_entity_added_and_removed(hass, index):
+    """Test adding and removing entities keeps the counters in step."""
+    hass.states.async_set("sensor.outdoor", STATE_UNAVAILABLE)
+    hass.states.async_set("sensor.indoor", STATE_UNKNOWN)
+    await hass.async_block_till_done()
+    assert index.entity_health["entities"] == 2
+    assert index.entity_health["unavailable"] == 1
+    assert index.entity_health["unknown"] == 1
+
+    hass.states.async_remove("sensor.outdoor")
+    await hass.async_block_till_done()
+    assert index.entity_health["entities"] == 1
+    assert index.entity_health["unavailable"] == 0
+    assert index.services == []
+
+    hass.states.async_remove("sensor.indoor")
+    await hass.async_block_till_done()
+    assert index.entity_health == {"entities": 0, "unavailable": 0, "unknown": 0, "domains": {}}
+
+    # A removed entity coming back is counted once
+    hass.states.async_set("sensor.outdoor", STATE_UNAVAILABLE)
+    await hass.async_block_till_done()
+    assert index.entity_health["entities"] == 1
+    assert index.entity_health["unavailable"] == 1
+
+
+async def test_grouped_by_integration(hass, index):
+    """Test services are grouped by the registry platform, not the domain."""
+    registry = er.async_get(hass)
+    hall = registry.async_get_or_create("sensor", "hue", "hall", suggested_object_id="hall")
+    lamp = registry.async_get_or_create("light", "hue", "lamp", suggested_object_id="lamp")
+    hass.states.async_set(hall.entity_id, STATE_UNAVAILABLE)
+    hass.states.async_set(lamp.entity_id, STATE_UNAVAILABLE)
+    hass.states.async_set("sensor.outdoor", STATE_UNAVAILABLE)
+    await hass.async_block_till_done()
+
+    assert {service["name"]: service["unavailable"] for service in index.services} == {
+        "hue": 2,
+        "sensor": 1,
+    }
+    assert index.entity_health["domains"] == {
+        "light": {STATE_UNAVAILABLE: 1, STATE_UNKNOWN: 0},
+        "sensor": {STATE_UNAVAILABLE: 2, STATE_UNKNOWN: 0},
+    }
+
+    hass.states.async_set(hall.entity_id, "on")
+    await hass.async_block_till_done()
+    assert {service["name"]: service["unavailable"] for service in index.services} == {
+        "hue": 1,
+        "sensor": 1,
+    }
+
+
+async def test_config_entry_failing_and_recovering(hass, index, entry):
+    """Test config entries are reported while they are in a failed state."""
+
+    entry.mock_state(hass, ConfigEntryState.SETUP_RETRY)
+    assert _entry_services(index) == [
+        {
+            "name": "hue",
+            "type": "config_entry",
+            "status": ConfigEntryState.SETUP_RETRY.value,
+            "entry_id": entry.entry_id,
+            "title": "Bridge",
+        }
+    ]
+
+    entry.mock_state(hass, ConfigEntryState.SETUP_ERROR)
+    assert [service["status"] for service in _entry_services(index)] == [
+        ConfigEntryState.SETUP_ERROR.value
+    ]
+
+    entry.mock_state(hass, ConfigEntryState.LOADED)
+    assert _entry_services(index) == []
+
+
+async def test_config_entry_removed(hass, index, entry):
+    """Test a removed config entry is no longer reported."""
+    entry.mock_state(hass, ConfigEntryState.SETUP_ERROR)
+    assert len(_entry_services(index)) == 1
+
+    async_dispatcher_send(hass, SIGNAL_CONFIG_ENTRY_CHANGED, ConfigEntryChange.REMOVED, entry)
+    await hass.async_block_till_done()
+    assert _entry_services(index) == []
+
+
+async def test_failed_entry_seeded_at_start(hass, entry):
+    """Test entries that already failed before the index started are reported."""
+    entry.mock_state(hass, ConfigEntryState.SETUP_RETRY)
+
+    index = PulseGuardHealthIndex(hass)
+    index.async_start()
+    assert [service["entry_id"] for service in _entry_services(index)] == [entry.entry_id]
+    index.async_stop()
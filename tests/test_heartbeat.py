@@ -0,0 +1,83 @@
+"""Tests for the PulseGuard heartbeat."""
+from datetime import timedelta
+
+import pytest
+from aiohttp import web
+from aiohttp.test_utils import TestServer
+from pytest_homeassistant_custom_component.common import async_fire_time_changed
+
+from homeassistant.util import dt as dt_util
+
+from custom_components.pulseguard.const import HEARTBEAT_UNSUPPORTED_RETRY
+from custom_components.pulseguard.heartbeat import PulseGuardHeartbeat
+
+
+@pytest.fixture
+async def server(socket_enabled):
+    """Run a server answering heartbeats with a configurable status."""
+    state = {"status": 200, "requests": 0}
+
+    async def _handle(request):
+        state["requests"] += 1
+        return web.Response(status=state["status"])
+
+    app = web.Application()
+    app.router.add_post("/api/devices/heartbeat", _handle)
+    test_server = TestServer(app)
+    await test_server.start_server()
+    state["api_url"] = str(test_server.make_url("/api"))
+    yield state
+    await test_server.close()
+
+
+async def _beat(heartbeat):
+    """Send one heartbeat and wait for it to finish."""
+    heartbeat._async_tick()
+    await heartbeat._pending
+
+
+async def test_heartbeat_sent(hass, server):
+    """Test heartbeats are posted while the server accepts them."""
+    heartbeat = PulseGuardHeartbeat(hass, "token", server["api_url"], interval=10)
+    heartbeat.async_start()
+
+    await _beat(heartbeat)
+    await _beat(heartbeat)
+
+    assert server["requests"] == 2
+    assert heartbeat.error_count == 0
+    assert heartbeat._unsub is not None
+    heartbeat.async_stop()
+
+
+@pytest.mark.parametrize("status", [404, 405])
+async def test_heartbeat_backs_off_without_endpoint(hass, server, status, caplog):
+    """Test the heartbeat pauses on a missing endpoint and tries again later."""
+    server["status"] = status
+    heartbeat = PulseGuardHeartbeat(hass, "token", server["api_url"], interval=10)
+    heartbeat.async_start()
+
+    await _beat(heartbeat)
+    assert heartbeat.unsupported
+    assert heartbeat._unsub is None
+    assert heartbeat.error_count == 0
+
+    # Still missing after backing off: no new warning, back off again
+    async_fire_time_changed(
+        hass, dt_util.utcnow() + timedelta(seconds=HEARTBEAT_UNSUPPORTED_RETRY)
+    )
+    await heartbeat._pending
+    assert server["requests"] == 2
+    assert heartbeat._unsub is None
+    assert caplog.text.count("does not support heartbeats") == 1
+
+    # The endpoint is back, so regular heartbeats resume
+    server["status"] = 200
+    async_fire_time_changed(
+        hass, dt_util.utcnow() + timedelta(seconds=2 * HEARTBEAT_UNSUPPORTED_RETRY)
+    )
+    await heartbeat._pending
+    assert server["requests"] == 3
+    assert not heartbeat.unsupported
+    assert heartbeat._unsub is not None
+    heartbeat.async_stop()
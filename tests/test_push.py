@@ -0,0 +1,229 @@
+"""Tests for the PulseGuard push channel."""
+import asyncio
+import json
+import logging
+from datetime import timedelta
+from unittest.mock import AsyncMock, patch
+
+import pytest
+from aiohttp import web
+from aiohttp.test_utils import TestServer
+from pytest_homeassistant_custom_component.common import MockConfigEntry
+
+from custom_components.pulseguard import PulseGuardCoordinator
+from custom_components.pulseguard.const import (
+    DOMAIN,
+    PUSH_MAX_UPDATE_INTERVAL,
+    PUSH_MIN_UPDATE_INTERVAL,
+)
+from custom_components.pulseguard.push import PulseGuardPushChannel, get_stream_url
+
+DEVICE_UUID = "914759c0-bcec-43be-a2b6-3d6f7bf67749"
+API_TOKEN = "apitoken123456"
+
+CHECK_IN = {"metrics": {"cpu_usage": 1.0, "memory_usage": 2.0, "disk_usage": 3.0, "uptime": 4}}
+
+
+class StandInServer:
+    """Local stand-in for the PulseGuard push endpoint."""
+
+    def __init__(self):
+        """Initialize the server."""
+        self.app = web.Application()
+        self.app.router.add_get("/api/devices/{uuid}/stream", self._handle)
+        self.received = asyncio.Queue()
+        self.connected = asyncio.Event()
+        self.auto_ack = True
+        self.token = None
+        self.ws = None
+
+    async def _handle(self, request):
+        """Accept a push channel and record what the device sends."""
+        self.token = request.headers.get("X-API-Token")
+        ws = web.WebSocketResponse()
+        await ws.prepare(request)
+        self.ws = ws
+        self.connected.set()
+
+        async for msg in ws:
+            message = json.loads(msg.data)
+            await self.received.put(message)
+            if self.auto_ack and message["type"] == "check-in":
+                await ws.send_json({"type": "ack", "id": message["id"]})
+        return ws
+
+    async def send(self, message):
+        """Send a raw or JSON message to the device."""
+        if isinstance(message, str):
+            await self.ws.send_str(message)
+        else:
+            await self.ws.send_json(message)
+
+
+@pytest.fixture
+async def stand_in(socket_enabled):
+    """Run the stand-in server."""
+    server = StandInServer()
+    test_server = TestServer(server.app)
+    await test_server.start_server()
+    server.api_url = str(test_server.make_url("/api"))
+    yield server
+    await test_server.close()
+
+
+@pytest.fixture
+async def coordinator(hass, stand_in):
+    """Return a coordinator with a connected push channel."""
+    entry = MockConfigEntry(domain=DOMAIN, data={})
+    entry.add_to_hass(hass)
+
+    coordinator = PulseGuardCoordinator(
+        hass,
+        logging.getLogger(__name__),
+        api_token=API_TOKEN,
+        device_uuid=DEVICE_UUID,
+        api_url=stand_in.api_url,
+    )
+    coordinator.push_channel = PulseGuardPushChannel(
+        hass,
+        coordinator,
+        api_token=API_TOKEN,
+        device_uuid=DEVICE_UUID,
+        api_url=stand_in.api_url,
+    )
+    coordinator.push_channel.async_start(entry)
+    await asyncio.wait_for(stand_in.connected.wait(), 5)
+    await _wait_for(lambda: coordinator.push_channel.connected)
+
+    yield coordinator
+
+    await coordinator.push_channel.async_stop()
+
+
+async def _wait_for(condition):
+    """Wait until a condition holds, or fail after a few seconds."""
+    for _ in range(500):
+        if condition():
+            return
+        await asyncio.sleep(0.01)
+    pytest.fail("Condition was not met in time")
+
+
+def test_stream_url():
+    """Test the push channel URL is derived from the API URL."""
+    assert (
+        get_stream_url("https://app.pulseguard.nl/api/", DEVICE_UUID)
+        == f"wss://app.pulseguard.nl/api/devices/{DEVICE_UUID}/stream"
+    )
+    assert (
+        get_stream_url("http://localhost:8000/api", DEVICE_UUID)
+        == f"ws://localhost:8000/api/devices/{DEVICE_UUID}/stream"
+    )
+
+
+async def test_connect_sends_token(hass, coordinator, stand_in):
+    """Test the channel authenticates with the API token."""
+    assert stand_in.token == API_TOKEN
+
+
+async def test_sample_command(hass, coordinator, stand_in):
+    """Test the server can request an immediate check-in."""
+    with patch.object(coordinator, "async_request_check_in", AsyncMock()) as request:
+        await stand_in.send({"type": "sample"})
+        await _wait_for(lambda: request.await_count == 1)
+
+
+@pytest.mark.parametrize(
+    ("seconds", "expected"),
+    [
+        (30, 30),
+        (1, PUSH_MIN_UPDATE_INTERVAL),
+        (999999, PUSH_MAX_UPDATE_INTERVAL),
+    ],
+)
+async def test_set_interval_command(hass, coordinator, stand_in, seconds, expected):
+    """Test the server can change the update interval within limits."""
+    await stand_in.send({"type": "set_interval", "seconds": seconds})
+    await _wait_for(lambda: coordinator.update_interval == timedelta(seconds=expected))
+
+
+@pytest.mark.parametrize(
+    "message",
+    [
+        "not json",
+        json.dumps({"no": "type"}),
+        json.dumps({"type": "set_interval", "seconds": "x"}),
+        '{"type": "set_interval", "seconds": 1e999}',
+        json.dumps({"type": "ack", "id": [1]}),
+    ],
+)
+async def test_malformed_messages(hass, coordinator, stand_in, message, caplog):
+    """Test malformed messages are ignored and the channel stays open."""
+    interval = coordinator.update_interval
+    await stand_in.send(message)
+    await _wait_for(lambda: "Ignoring" in caplog.text)
+
+    assert coordinator.update_interval == interval
+
+    # The channel keeps reading messages
+    await stand_in.send({"type": "set_interval", "seconds": 45})
+    await _wait_for(lambda: coordinator.update_interval == timedelta(seconds=45))
+    assert coordinator.push_channel.connected
+
+
+async def test_failing_message_keeps_channel_open(hass, coordinator, stand_in, caplog):
+    """Test an unexpected error while handling a message is logged, not fatal."""
+    with patch("custom_components.pulseguard.push.timedelta", side_effect=RuntimeError):
+        await stand_in.send({"type": "set_interval", "seconds": 30})
+        await _wait_for(lambda: "Error handling push message" in caplog.text)
+
+    await stand_in.send({"type": "set_interval", "seconds": 45})
+    await _wait_for(lambda: coordinator.update_interval == timedelta(seconds=45))
+    assert coordinator.push_channel.connected
+
+
+async def test_acked_check_in_skips_http(hass, coordinator, stand_in):
+    """Test an acknowledged check-in is not posted over HTTP."""
+    with patch.object(coordinator, "_send_check_in", return_value=None) as send_http:
+        await coordinator._async_send_check_in(CHECK_IN)
+
+    message = await asyncio.wait_for(stand_in.received.get(), 5)
+    assert message["type"] == "check-in"
+    assert message["data"] == CHECK_IN
+    send_http.assert_not_called()
+
+
+async def test_unacked_check_in_falls_back_to_http(hass, coordinator, stand_in):
+    """Test a check-in the server doesn't acknowledge is posted over HTTP."""
+    stand_in.auto_ack = False
+    with patch("custom_components.pulseguard.push.PUSH_ACK_TIMEOUT", 0.1), patch.object(
+        coordinator, "_send_check_in", return_value=None
+    ) as send_http:
+        await coordinator._async_send_check_in(CHECK_IN)
+
+    send_http.assert_called_once_with(CHECK_IN)
+
+
+async def test_stops_streaming_after_missed_acks(hass, coordinator, stand_in):
+    """Test check-ins go straight to HTTP once the server stops acking."""
+    stand_in.auto_ack = False
+    with patch("custom_components.pulseguard.push.PUSH_ACK_TIMEOUT", 0.1), patch(
+        "custom_components.pulseguard.push.PUSH_MAX_MISSED_ACKS", 2
+    ), patch.object(coordinator, "_send_check_in", return_value=None) as send_http:
+        for _ in range(3):
+            await coordinator._async_send_check_in(CHECK_IN)
+
+    assert send_http.call_count == 3
+    assert stand_in.received.qsize() == 2
+
+
+async def test_http_fallback_after_disconnect(hass, coordinator, stand_in):
+    """Test check-ins are posted over HTTP once the server closes the channel."""
+    await stand_in.ws.close()
+    await _wait_for(lambda: not coordinator.push_channel.connected)
+
+    with patch.object(coordinator, "_send_check_in", return_value=None) as send_http:
+        await coordinator._async_send_check_in(CHECK_IN)
+
+    send_http.assert_called_once_with(CHECK_IN)
+    assert stand_in.received.empty()
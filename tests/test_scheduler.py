@@ -0,0 +1,82 @@
+"""Tests for the PulseGuard adaptive upload scheduler."""
+import logging
+from unittest.mock import MagicMock, patch
+
+from custom_components.pulseguard import PulseGuardCoordinator
+from custom_components.pulseguard.scheduler import PulseGuardUploadScheduler
+
+TICK = 60
+
+
+def _metrics(cpu=10.0, memory=40.0, disk=50.0):
+    """Return a metrics sample."""
+    return {"cpu_usage": cpu, "memory_usage": memory, "disk_usage": disk, "uptime": 0}
+
+
+def _run(scheduler, samples):
+    """Feed samples one tick apart, recording every upload, return the count."""
+    uploads = 0
+    for tick, metrics in enumerate(samples):
+        now = tick * TICK
+        if scheduler.should_upload(metrics, TICK, now):
+            scheduler.record_upload(metrics, TICK, now)
+            uploads += 1
+    return uploads
+
+
+def test_stable_metrics_stretch_interval():
+    """Test uploads become rarer while metrics are stable."""
+    scheduler = PulseGuardUploadScheduler(max_interval=600)
+    assert _run(scheduler, [_metrics()] * 30) < 10
+    assert scheduler.interval == 600
+
+
+def test_full_disk_does_not_keep_scheduler_busy():
+    """Test a constant high disk usage doesn't force an upload every tick."""
+    scheduler = PulseGuardUploadScheduler(max_interval=600)
+    assert _run(scheduler, [_metrics(disk=90.0)] * 10) < 5
+
+
+def test_high_cpu_uploads_every_tick():
+    """Test CPU close to the alert level keeps uploads at the sampling rate."""
+    scheduler = PulseGuardUploadScheduler(max_interval=600)
+    assert _run(scheduler, [_metrics(cpu=95.0)] * 10) == 10
+
+
+def test_unrecorded_upload_is_retried():
+    """Test a forced upload stays due until it has been recorded."""
+    scheduler = PulseGuardUploadScheduler(max_interval=600)
+    _run(scheduler, [_metrics()] * 3)
+
+    scheduler.request_upload()
+    assert scheduler.should_upload(_metrics(), TICK, 3 * TICK)
+    # Delivery failed, so nothing was recorded
+    assert scheduler.should_upload(_metrics(), TICK, 4 * TICK)
+    scheduler.record_upload(_metrics(), TICK, 4 * TICK)
+    assert not scheduler.should_upload(_metrics(), TICK, 5 * TICK)
+
+
+async def test_failed_check_in_is_retried(hass):
+    """Test the coordinator retries a check-in whose delivery failed."""
+    coordinator = PulseGuardCoordinator(
+        hass,
+        logging.getLogger(__name__),
+        api_token="token",
+        device_uuid="uuid",
+        api_url="http://localhost",
+    )
+    coordinator.upload_scheduler = PulseGuardUploadScheduler(max_interval=600)
+    delivered = MagicMock(status_code=200)
+    data = {"metrics": _metrics(), "services": [], "additional_metrics": {}}
+
+    with patch.object(
+        coordinator, "_get_system_stats", side_effect=lambda: dict(data, additional_metrics={})
+    ), patch.object(coordinator, "_send_check_in", side_effect=[None, delivered, delivered]) as send:
+        await coordinator._async_update_data()
+        await coordinator._async_update_data()
+        assert send.call_count == 2
+        assert coordinator.upload_scheduler.last_upload_time is not None
+
+        # Delivered and stable, so the next tick is skipped
+        await coordinator._async_update_data()
+        assert send.call_count == 2
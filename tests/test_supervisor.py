@@ -0,0 +1,218 @@
+"""Tests for the PulseGuard Supervisor add-on stats."""
+import asyncio
+from unittest.mock import patch
+
+import pytest
+from aiohttp import web
+from aiohttp.test_utils import TestServer
+
+from custom_components.pulseguard.supervisor import PulseGuardSupervisorStats
+
+TOKEN = "supervisor-token"
+
+
+class MockSupervisor:
+    """Local mock of the Supervisor add-on endpoints."""
+
+    def __init__(self, addons):
+        """Initialize the mock with a number of running add-ons."""
+        self.app = web.Application()
+        self.app.router.add_get("/addons", self._addons)
+        self.app.router.add_get("/addons/{slug}/stats", self._stats)
+        self.addons = [f"addon_{i}" for i in range(addons)]
+        self.cpu = {slug: 1.0 for slug in self.addons}
+        self.failing = set()
+        self.malformed = {}
+        self.list_failing = False
+        self.list_malformed = None
+        self.delay = 0
+        self.list_requests = 0
+        self.stats_requests = []
+
+    async def _addons(self, request):
+        """Return the list of installed add-ons."""
+        assert request.headers["Authorization"] == f"Bearer {TOKEN}"
+        self.list_requests += 1
+        if self.list_failing:
+            return web.Response(status=500)
+        if self.list_malformed is not None:
+            return web.json_response({"result": "ok", "data": self.list_malformed})
+        return web.json_response(
+            {
+                "result": "ok",
+                "data": {
+                    "addons": [
+                        {"slug": slug, "name": slug.title(), "state": "started"}
+                        for slug in self.addons
+                    ]
+                    + [{"slug": "stopped", "name": "Stopped", "state": "stopped"}]
+                },
+            }
+        )
+
+    async def _stats(self, request):
+        """Return the stats of an add-on."""
+        slug = request.match_info["slug"]
+        self.stats_requests.append(slug)
+        await asyncio.sleep(self.delay)
+        if slug in self.failing:
+            return web.Response(status=500)
+        if slug in self.malformed:
+            return web.json_response({"result": "ok", "data": self.malformed[slug]})
+        return web.json_response(
+            {
+                "result": "ok",
+                "data": {
+                    "cpu_percent": self.cpu[slug],
+                    "memory_percent": 2.0,
+                    "memory_usage": 256 * 1024 * 1024,
+                    "network_rx": 100,
+                    "network_tx": 200,
+                },
+            }
+        )
+
+
+@pytest.fixture
+async def supervisor(socket_enabled):
+    """Run a mock Supervisor with three add-ons."""
+    mock = MockSupervisor(3)
+    server = TestServer(mock.app)
+    await server.start_server()
+    mock.url = str(server.make_url(""))
+    yield mock
+    await server.close()
+
+
+async def test_collects_running_addons(hass, supervisor):
+    """Test stats are collected for running add-ons only."""
+    stats = PulseGuardSupervisorStats(hass, supervisor.url, TOKEN)
+    addons = await stats.async_update()
+
+    assert list(addons) == ["addon_0", "addon_1", "addon_2"]
+    assert addons["addon_0"] == {
+        "name": "Addon_0",
+        "cpu_usage": 1.0,
+        "memory_usage": 2.0,
+        "memory_used": 256,
+        "network_rx": 100,
+        "network_tx": 200,
+    }
+
+
+async def test_stats_are_cached(hass, supervisor):
+    """Test stats are not fetched again until the cache expires."""
+    stats = PulseGuardSupervisorStats(hass, supervisor.url, TOKEN)
+    await stats.async_update()
+    await stats.async_update()
+    assert len(supervisor.stats_requests) == 3
+    assert supervisor.list_requests == 1
+
+    supervisor.cpu["addon_1"] = 50.0
+    with patch("custom_components.pulseguard.supervisor.SUPERVISOR_STATS_TTL", 0):
+        addons = await stats.async_update()
+    assert len(supervisor.stats_requests) == 6
+    assert addons["addon_1"]["cpu_usage"] == 50.0
+
+
+async def test_fetches_are_limited_per_update(hass, socket_enabled):
+    """Test only a limited number of add-ons is refreshed per update."""
+    mock = MockSupervisor(12)
+    server = TestServer(mock.app)
+    await server.start_server()
+    try:
+        stats = PulseGuardSupervisorStats(hass, str(server.make_url("")), TOKEN)
+        with patch("custom_components.pulseguard.supervisor.SUPERVISOR_MAX_FETCHES", 8):
+            addons = await stats.async_update()
+            assert len(mock.stats_requests) == 8
+            assert len(addons) == 8
+
+            # The add-ons that were left out are fetched next time
+            addons = await stats.async_update()
+            assert len(mock.stats_requests) == 12
+            assert len(addons) == 12
+    finally:
+        await server.close()
+
+
+async def test_failed_fetch_keeps_cached_stats(hass, supervisor):
+    """Test a failed fetch keeps serving the previous stats."""
+    stats = PulseGuardSupervisorStats(hass, supervisor.url, TOKEN)
+    await stats.async_update()
+
+    supervisor.cpu["addon_0"] = 99.0
+    supervisor.failing.add("addon_0")
+    with patch("custom_components.pulseguard.supervisor.SUPERVISOR_STATS_TTL", 0):
+        addons = await stats.async_update()
+
+    assert addons["addon_0"]["cpu_usage"] == 1.0
+
+
+@pytest.mark.parametrize(
+    "data",
+    [
+        {"cpu_percent": None, "memory_percent": 2.0},
+        {"cpu_percent": "x"},
+        ["not", "a", "dict"],
+        None,
+    ],
+)
+async def test_malformed_stats_keep_cached_stats(hass, supervisor, data):
+    """Test unexpected stats data keeps the cached stats of that add-on only."""
+    stats = PulseGuardSupervisorStats(hass, supervisor.url, TOKEN)
+    await stats.async_update()
+
+    supervisor.cpu["addon_1"] = 50.0
+    supervisor.malformed["addon_0"] = data
+    with patch("custom_components.pulseguard.supervisor.SUPERVISOR_STATS_TTL", 0):
+        addons = await stats.async_update()
+
+    assert addons["addon_0"]["cpu_usage"] == 1.0
+    assert addons["addon_1"]["cpu_usage"] == 50.0
+
+
+@pytest.mark.parametrize(
+    "data",
+    [
+        {"addons": [{"name": "No slug", "state": "started"}]},
+        {"addons": ["addon_0"]},
+        ["not", "a", "dict"],
+    ],
+)
+async def test_malformed_addon_list_keeps_cached_list(hass, supervisor, data):
+    """Test an unexpected add-on list keeps the known add-ons."""
+    stats = PulseGuardSupervisorStats(hass, supervisor.url, TOKEN)
+    await stats.async_update()
+
+    supervisor.list_malformed = data
+    with patch("custom_components.pulseguard.supervisor.SUPERVISOR_ADDONS_TTL", 0):
+        addons = await stats.async_update()
+
+    assert len(addons) == 3
+
+
+async def test_failed_addon_list_is_retried(hass, supervisor):
+    """Test a failed add-on list fetch is retried on the next update."""
+    stats = PulseGuardSupervisorStats(hass, supervisor.url, TOKEN)
+    supervisor.list_failing = True
+    assert await stats.async_update() == {}
+
+    supervisor.list_failing = False
+    addons = await stats.async_update()
+    assert supervisor.list_requests == 2
+    assert len(addons) == 3
+
+
+async def test_slow_supervisor_returns_cached_stats(hass, supervisor):
+    """Test a slow Supervisor doesn't hold up the update past its deadline."""
+    stats = PulseGuardSupervisorStats(hass, supervisor.url, TOKEN)
+    await stats.async_update()
+
+    supervisor.delay = 1
+    with patch("custom_components.pulseguard.supervisor.SUPERVISOR_STATS_TTL", 0), patch(
+        "custom_components.pulseguard.supervisor.SUPERVISOR_UPDATE_TIMEOUT", 0.1
+    ):
+        addons = await asyncio.wait_for(stats.async_update(), 0.5)
+
+    assert len(addons) == 3
+    assert addons["addon_0"]["cpu_usage"] == 1.0
@@ -0,0 +1,69 @@
+"""Tests for the PulseGuard worker pool."""
+import asyncio
+import threading
+
+import pytest
+
+from custom_components.pulseguard.worker import (
+    PulseGuardWorkerPool,
+    WorkerJobDropped,
+    WorkerQueueFull,
+)
+
+
+@pytest.fixture
+async def pool(hass):
+    """Return a pool with one thread and three queue slots."""
+    pool = PulseGuardWorkerPool(hass, max_workers=1, max_queue=3)
+    yield pool
+    pool.async_shutdown()
+    await hass.async_add_executor_job(pool._executor.shutdown)
+
+
+@pytest.fixture
+async def busy(hass, pool):
+    """Keep the only thread busy until the test releases it."""
+    release = threading.Event()
+    job = hass.async_create_task(pool.async_run(release.wait, 5))
+    await asyncio.sleep(0)
+    assert pool.running == 1
+    yield release
+    release.set()
+    await job
+
+
+async def test_timed_out_jobs_free_the_queue(hass, pool, busy):
+    """Test jobs whose caller timed out don't fill up the queue."""
+    for _ in range(3):
+        with pytest.raises(asyncio.TimeoutError):
+            await asyncio.wait_for(pool.async_run(lambda: None), 0.01)
+
+    assert pool.stats["queue_depth"] == 0
+
+    job = hass.async_create_task(pool.async_run(lambda: "done"))
+    await asyncio.sleep(0)
+    assert pool.stats["queue_depth"] == 1
+    assert pool.dropped == 0
+
+    busy.set()
+    assert await job == "done"
+
+
+async def test_full_queue(hass, pool, busy):
+    """Test the oldest droppable job makes room, otherwise the queue is full."""
+    dropped = hass.async_create_task(pool.async_run(lambda: None, droppable=True))
+    kept = [hass.async_create_task(pool.async_run(lambda: None)) for _ in range(2)]
+    await asyncio.sleep(0)
+
+    job = hass.async_create_task(pool.async_run(lambda: "done"))
+    await asyncio.sleep(0)
+    assert pool.dropped == 1
+    with pytest.raises(WorkerJobDropped):
+        await dropped
+
+    with pytest.raises(WorkerQueueFull):
+        await pool.async_run(lambda: None)
+
+    busy.set()
+    assert await job == "done"
+    await asyncio.gather(*kept)